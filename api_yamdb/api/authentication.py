@@ -0,0 +1,53 @@
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from reviews.models import User
+
+from .cache import get_cache
+
+USER_CLAIMS = ("username", "role", "is_staff", "is_superuser")
+USER_STATE_KEY = "api:auth:user:{}"
+
+
+def user_state_key(user_id):
+    return USER_STATE_KEY.format(user_id)
+
+
+def cache_user_state(user):
+    get_cache().set(
+        user_state_key(user.pk),
+        tuple(getattr(user, claim) for claim in USER_CLAIMS),
+        settings.AUTH_USER_CACHE_TIMEOUT,
+    )
+
+
+def forget_user_state(user_id):
+    get_cache().delete(user_state_key(user_id))
+
+
+class UserClaimsAccessToken(AccessToken):
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        if any(claim not in validated_token for claim in USER_CLAIMS):
+            return super().get_user(validated_token)
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        state = get_cache().get(user_state_key(user_id))
+        if state is None:
+            user = super().get_user(validated_token)
+            cache_user_state(user)
+            return user
+        claims = {claim: validated_token[claim] for claim in USER_CLAIMS}
+        if state != tuple(claims.values()):
+            return super().get_user(validated_token)
+        return User(id=user_id, **claims)
@@ -0,0 +1,212 @@
+import time
+from collections import namedtuple
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .db import read_from_replica
+
+VERSION_KEY = "api:version:{}"
+RESPONSE_KEY = "api:response:{}:{}:{}"
+
+Version = namedtuple("Version", ("token", "modified"))
+
+
+def get_cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def is_shared_cache():
+    return not isinstance(get_cache(), LocMemCache)
+
+
+def new_version(previous=None):
+    # Last-Modified точен до секунды: запись в ту же секунду, что и
+    # прошлая версия, сдвигает время вперёд, иначе If-Modified-Since
+    # вернул бы 304 с устаревшими данными.
+    modified = int(time.time())
+    if previous is not None:
+        modified = max(modified, previous.modified + 1)
+    return Version(uuid4().hex, modified)
+
+
+def get_versions(*namespaces):
+    cache = get_cache()
+    keys = [VERSION_KEY.format(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_version(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def get_version(namespace):
+    return get_versions(namespace)[0]
+
+
+def invalidate(*namespaces):
+    # До фиксации транзакции параллельное чтение ещё видит старые данные и
+    # сохранило бы их под новой версией.
+    transaction.on_commit(lambda: bump_versions(*namespaces))
+
+
+def bump_versions(*namespaces):
+    cache = get_cache()
+    keys = [VERSION_KEY.format(namespace) for namespace in namespaces]
+    previous = cache.get_many(keys)
+    cache.set_many(
+        {key: new_version(previous.get(key)) for key in keys}, None
+    )
+
+
+def normalized_query(request):
+    return "&".join(
+        f"{key}={value}"
+        for key, values in sorted(request.query_params.lists())
+        for value in sorted(values)
+        if value
+    )
+
+
+def request_location(request):
+    return (
+        f"{request.scheme}://{request.get_host()}{request.path}"
+        f"?{normalized_query(request)}"
+    )
+
+
+def response_cache_key(request, namespace, version):
+    return RESPONSE_KEY.format(
+        namespace,
+        version.token,
+        md5(request_location(request).encode()).hexdigest(),
+    )
+
+
+def read_primary_after_change(modified):
+    # Реплика может отставать: в первые секунды после записи ответ,
+    # который попадёт в кэш под новой версией, читается из основной базы.
+    if time.time() - modified < settings.REPLICA_LAG_WINDOW:
+        read_from_replica.set(False)
+
+
+class SlugMap:
+
+    def __init__(self, model, namespace):
+        self.model = model
+        self.namespace = namespace
+        self.token = None
+        self.loaded = None
+        self.rows = {}
+
+    def load(self, token):
+        self.rows = {
+            row["slug"]: row for row in self.model.objects.values()
+        }
+        self.token = token
+        self.loaded = time.monotonic()
+
+    def get(self, slug):
+        # Версия видна всем процессам только в общем кэше, поэтому карта
+        # ещё и устаревает по времени, а промах перепроверяется по базе.
+        token = get_version(self.namespace).token
+        expired = (
+            self.loaded is None
+            or time.monotonic() - self.loaded >= settings.SLUG_MAP_TIMEOUT
+        )
+        if token != self.token or expired or slug not in self.rows:
+            self.load(token)
+        row = self.rows.get(slug)
+        if row is None:
+            return None
+        return self.model.from_db(
+            self.model.objects.db, list(row), list(row.values())
+        )
+
+
+class CachedListMixin:
+    cache_namespace = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        # Запись в другом процессе не сбросит версии в его LocMemCache:
+        # ответы остались бы устаревшими до API_CACHE_TIMEOUT.
+        if request.user.is_authenticated or not is_shared_cache():
+            return handler(request, *args, **kwargs)
+        cache = get_cache()
+        version = get_version(self.cache_namespace)
+        key = response_cache_key(request, self.cache_namespace, version)
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        read_primary_after_change(version.modified)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+        return response
+
+
+class CachedReadMixin(CachedListMixin):
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class ConditionalGetMixin:
+    etag_namespaces = ()
+
+    def get_etag_namespaces(self):
+        return tuple(
+            namespace.format(**self.kwargs)
+            for namespace in self.etag_namespaces
+        )
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def get_validators(self, request):
+        versions = get_versions(*self.get_etag_namespaces())
+        fingerprint = "|".join(
+            [request_location(request), request.accepted_media_type]
+            + [version.token for version in versions]
+        )
+        etag = quote_etag(md5(fingerprint.encode()).hexdigest())
+        return etag, max(version.modified for version in versions)
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        # Версии в LocMemCache у каждого процесса свои: процесс, не
+        # видевший записи, отвечал бы 304 с устаревшими данными.
+        if not is_shared_cache():
+            return handler(request, *args, **kwargs)
+        etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            read_primary_after_change(last_modified)
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
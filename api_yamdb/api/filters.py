@@ -1,13 +1,21 @@
 from django_filters.rest_framework import CharFilter, FilterSet, NumberFilter
+from reviews import search
 from reviews.models import Title
 
 
 class TitleFilter(FilterSet):
-    name = CharFilter(field_name="name", lookup_expr="icontains")
+    name = CharFilter(method="filter_name")
     category = CharFilter(field_name="category__slug")
     genre = CharFilter(field_name="genre__slug")
     year = NumberFilter(field_name="year")
+    search = CharFilter(method="filter_search")
 
     class Meta:
         model = Title
-        fields = ("name", "category", "genre", "year",)
+        fields = ("name", "category", "genre", "year", "search")
+
+    def filter_name(self, queryset, name, value):
+        return search.filter_by_name(queryset, value)
+
+    def filter_search(self, queryset, name, value):
+        return search.search(queryset, value)
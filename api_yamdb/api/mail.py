@@ -0,0 +1,96 @@
+from datetime import timedelta
+from smtplib import SMTPException
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import transaction
+from django.utils import timezone
+from reviews.models import ConfirmationMail
+
+from .utils import confirmation_message
+
+
+def retry_delay(attempts):
+    return timedelta(
+        seconds=settings.CONFIRMATION_MAIL_RETRY_DELAY * 2 ** (attempts - 1)
+    )
+
+
+def claim_mails(batch_size):
+    # Письма захватываются одним условным UPDATE: строку, которую уже
+    # перенёс другой отправщик, он не перезапишет. Это работает и на SQLite,
+    # где skip_locked не поддерживается.
+    now = timezone.now()
+    lease = uuid4()
+    candidates = (
+        ConfirmationMail.objects.select_for_update(
+            skip_locked=True, of=("self",)
+        )
+        .filter(
+            next_attempt__lte=now,
+            attempts__lt=settings.CONFIRMATION_MAIL_MAX_ATTEMPTS,
+        )
+        .values("pk")[:batch_size]
+    )
+    with transaction.atomic():
+        claimed = ConfirmationMail.objects.filter(
+            pk__in=candidates, next_attempt__lte=now
+        ).update(
+            lease=lease,
+            next_attempt=now + timedelta(
+                seconds=settings.CONFIRMATION_MAIL_LEASE
+            ),
+        )
+    if not claimed:
+        return []
+    return list(
+        ConfirmationMail.objects.filter(lease=lease).select_related("user")
+    )
+
+
+def send_confirmation_mails(batch_size=None, connection=None):
+    batch_size = batch_size or settings.CONFIRMATION_MAIL_BATCH_SIZE
+    mails = claim_mails(batch_size)
+    if not mails:
+        return 0, 0
+    sent, failed = deliver(mails, connection or get_connection())
+    now = timezone.now()
+    for mail in failed:
+        mail.attempts += 1
+        mail.next_attempt = now + retry_delay(mail.attempts)
+        mail.lease = None
+    with transaction.atomic():
+        ConfirmationMail.objects.filter(
+            pk__in=[mail.pk for mail in sent]
+        ).delete()
+        ConfirmationMail.objects.bulk_update(
+            failed, ("attempts", "next_attempt", "error", "lease")
+        )
+    return len(sent), len(failed)
+
+
+def deliver(mails, connection):
+    sent, failed, delivered = [], [], set()
+    try:
+        connection.open()
+    except (SMTPException, OSError) as error:
+        for mail in mails:
+            mail.error = str(error)
+        return sent, mails
+    try:
+        for mail in mails:
+            if mail.user_id in delivered:
+                sent.append(mail)
+                continue
+            try:
+                confirmation_message(mail.user, connection).send()
+            except Exception as error:
+                mail.error = f"{type(error).__name__}: {error}"
+                failed.append(mail)
+            else:
+                delivered.add(mail.user_id)
+                sent.append(mail)
+    finally:
+        connection.close()
+    return sent, failed
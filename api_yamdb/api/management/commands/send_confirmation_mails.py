@@ -0,0 +1,44 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.mail import send_confirmation_mails
+
+
+class Command(BaseCommand):
+    help = "Отправляет письма с кодом подтверждения из очереди"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.CONFIRMATION_MAIL_BATCH_SIZE,
+            help="Количество писем, отправляемых через одно соединение",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Не завершаться, а проверять очередь каждые --interval с",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Пауза между проверками пустой очереди, с",
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        while True:
+            sent, failed = send_confirmation_mails(options["batch_size"])
+            total_sent += sent
+            total_failed += failed
+            if sent + failed == options["batch_size"]:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(
+            f"Отправлено писем: {total_sent}, ошибок: {total_failed}"
+        )
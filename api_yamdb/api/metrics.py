@@ -0,0 +1,102 @@
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+METRICS = ("queries", "db", "serialize", "total")
+PERCENTILES = (50, 95, 99)
+
+request_metrics = ContextVar("request_metrics", default=None)
+
+_samples = {}
+_lock = threading.Lock()
+
+
+class RequestMetrics:
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.total = 0.0
+
+    def finish(self):
+        finished = time.perf_counter()
+        self.total = finished - self.started
+        if self.view_started is not None:
+            self.serialize = max(finished - self.view_started - self.db, 0)
+
+    def server_timing(self):
+        return ", ".join((
+            f'db;desc="{self.queries} queries";dur={self.db * 1000:.3f}',
+            f"serialize;dur={self.serialize * 1000:.3f}",
+            f"total;dur={self.total * 1000:.3f}",
+        ))
+
+
+def record_query(execute, sql, params, many, context):
+    metrics = request_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db += time.perf_counter() - started
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def route_samples(route):
+    samples = _samples.get(route)
+    if samples is None:
+        with _lock:
+            samples = _samples.setdefault(route, {
+                metric: deque(maxlen=settings.API_METRICS_SAMPLES)
+                for metric in METRICS
+            })
+    return samples
+
+
+def record(route, metrics):
+    samples = route_samples(route)
+    samples["queries"].append(metrics.queries)
+    for metric in ("db", "serialize", "total"):
+        samples[metric].append(getattr(metrics, metric) * 1000)
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def report():
+    with _lock:
+        items = sorted(_samples.items())
+    routes = OrderedDict()
+    for route, samples in items:
+        routes[route] = OrderedDict(count=len(samples["total"]))
+        for metric in METRICS:
+            values = list(samples[metric])
+            routes[route][metric] = OrderedDict(
+                (f"p{percent}", round(percentile(values, percent), 3))
+                for percent in PERCENTILES
+            )
+    return routes
+
+
+def reset():
+    with _lock:
+        _samples.clear()
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+from .db import read_from_replica
+from .metrics import RequestMetrics, record, request_metrics
+
+
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        token = read_from_replica.set(request.method in SAFE_METHODS)
+        try:
+            return self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+
+    async def __acall__(self, request):
+        token = read_from_replica.set(request.method in SAFE_METHODS)
+        try:
+            return await self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = request_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = request_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = request_metrics.get()
+        if metrics is not None:
+            metrics.view_started = time.perf_counter()
+
+    def finish(self, request, response, metrics):
+        metrics.finish()
+        if settings.API_SERVER_TIMING:
+            response["Server-Timing"] = metrics.server_timing()
+        if request.resolver_match is not None:
+            record(request.resolver_match.view_name, metrics)
+        return response
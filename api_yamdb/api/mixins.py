@@ -1,13 +1,19 @@
-from rest_framework import viewsets
+from django.utils.functional import cached_property
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.filters import SearchFilter
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
 from rest_framework.mixins import (CreateModelMixin,
                                    ListModelMixin,
                                    DestroyModelMixin)
 
-from .permissions import IsAdminOrReadOnly
+from .cache import CachedListMixin
+from .permissions import IsAdmin, IsAdminOrReadOnly
 
 
-class CategoryAndGenreMixinViewSet(CreateModelMixin,
+class CategoryAndGenreMixinViewSet(CachedListMixin,
+                                   CreateModelMixin,
                                    ListModelMixin,
                                    DestroyModelMixin,
                                    viewsets.GenericViewSet):
@@ -15,3 +21,48 @@ class CategoryAndGenreMixinViewSet(CreateModelMixin,
     filter_backends = (SearchFilter,)
     search_fields = ("name",)
     lookup_field = "slug"
+
+
+class ParentObjectMixin:
+    parent_model = None
+    parent_field = None
+    parent_lookups = {}
+
+    def get_parent_filter(self, prefix=""):
+        return {
+            f"{prefix}{field}": self.kwargs.get(kwarg)
+            for field, kwarg in self.parent_lookups.items()
+        }
+
+    @cached_property
+    def parent(self):
+        return get_object_or_404(
+            self.parent_model, **self.get_parent_filter()
+        )
+
+    def filter_by_parent(self, queryset):
+        return queryset.filter(
+            **self.get_parent_filter(f"{self.parent_field}__")
+        )
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if not page:
+            # Пустая страница: отличаем отсутствие родителя от пустого списка.
+            self.parent
+        return page
+
+
+class BulkCreateMixin:
+    bulk_serializer_class = None
+
+    @action(detail=False, methods=["post"], permission_classes=(IsAdmin,))
+    def bulk(self, request, *args, **kwargs):
+        serializer = self.bulk_serializer_class(
+            data=request.data,
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -21,6 +21,6 @@ class IsAuthorOrModeratorOrAdminOrReadOnly(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         return (request.method in permissions.SAFE_METHODS
-                or obj.author == request.user
+                or obj.author_id == request.user.id
                 or request.user.is_moderator
                 or request.user.is_admin)
@@ -1,11 +1,88 @@
 from django.conf import settings
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
+from django.utils.encoding import smart_str
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
-from rest_framework.generics import get_object_or_404
+from rest_framework.settings import api_settings
 from rest_framework.validators import UniqueValidator
-from reviews.models import Category, Comment, Genre, Review, Title, User
+from reviews.bulk import bulk_create_with_pks
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title, User)
+from reviews.ratings import change_rating
 from reviews.validators import UsernameValidatorMixin
 
+from .cache import SlugMap, invalidate
+
+CATEGORY_SLUGS = SlugMap(Category, "categories")
+GENRE_SLUGS = SlugMap(Genre, "genres")
+REVIEW_EXISTS = "Your review is already exist!"
+
+
+def resolve_authors(items):
+    usernames = {item["author"]["username"] for item in items}
+    users = {
+        user.username: user
+        for user in User.objects.filter(username__in=usernames)
+    }
+    errors = []
+    for item in items:
+        username = item["author"]["username"]
+        if username in users:
+            item["author"] = users[username]
+            errors.append({})
+        else:
+            errors.append(
+                {"author": [f"Пользователь {username} не найден."]}
+            )
+    return errors
+
+
+class BulkListSerializer(serializers.ListSerializer):
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("allow_empty", False)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            return super().to_internal_value(data)
+        if not self.allow_empty and not data:
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [
+                    self.error_messages["empty"]
+                ]},
+                code="empty",
+            )
+        limit = settings.BULK_CREATE_MAX_ITEMS
+        if len(data) > limit:
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [
+                f"Не больше {limit} объектов в одном запросе."
+            ]})
+        items, errors = [], []
+        for item in data:
+            try:
+                items.append(self.child.run_validation(item))
+                errors.append({})
+            except ValidationError as exc:
+                items.append(None)
+                errors.append(exc.detail)
+        batch_errors = iter(self.child.validate_batch(
+            [item for item in items if item is not None]
+        ))
+        errors = [
+            error if item is None else next(batch_errors)
+            for item, error in zip(items, errors)
+        ]
+        if any(errors):
+            raise ValidationError(errors)
+        return items
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            return self.child.create_batch(validated_data)
+
 
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -26,23 +103,55 @@ class TitleReadSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Title
-        fields = "__all__"
+        exclude = ("rating_sum", "rating_count")
+
+
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+
+    def __init__(self, slug_map, **kwargs):
+        self.slug_map = slug_map
+        super().__init__(
+            queryset=slug_map.model.objects.all(), slug_field="slug", **kwargs
+        )
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail("invalid")
+        obj = self.slug_map.get(data)
+        if obj is None:
+            self.fail("does_not_exist", slug_name=self.slug_field,
+                      value=smart_str(data))
+        return obj
 
 
 class TitleWriteSerializer(serializers.ModelSerializer):
-    category = serializers.SlugRelatedField(
-        queryset=Category.objects.all(),
-        slug_field="slug",
-    )
-    genre = serializers.SlugRelatedField(
-        queryset=Genre.objects.all(),
-        slug_field="slug",
-        many=True,
-    )
+    category = CachedSlugRelatedField(CATEGORY_SLUGS)
+    genre = CachedSlugRelatedField(GENRE_SLUGS, many=True)
 
     class Meta:
         model = Title
-        fields = "__all__"
+        exclude = ("rating_sum", "rating_count")
+        list_serializer_class = BulkListSerializer
+
+    def validate_batch(self, items):
+        return [{} for _ in items]
+
+    def create_batch(self, items):
+        titles = bulk_create_with_pks(Title, [
+            Title(**{
+                field: value for field, value in item.items()
+                if field != "genre"
+            })
+            for item in items
+        ])
+        GenreTitle.objects.bulk_create(
+            GenreTitle(title=title, genre=genre)
+            for title, item in zip(titles, items)
+            for genre in dict.fromkeys(item["genre"])
+        )
+        prefetch_related_objects(titles, "genre")
+        invalidate("titles")
+        return titles
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -61,17 +170,61 @@ class ReviewSerializer(serializers.ModelSerializer):
             "pub_date",
         )
 
-    def validate(self, data):
-        request = self.context["request"]
-        author = request.user
-        title_id = self.context.get("view").kwargs.get("title_id")
-        title = get_object_or_404(Title, pk=title_id)
-        if (
-                request.method == "POST"
-                and Review.objects.filter(title=title, author=author).exists()
-        ):
-            raise ValidationError("Your review is already exist!")
-        return data
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            if not Review.objects.filter(
+                title=validated_data["title"],
+                author=validated_data["author"],
+            ).exists():
+                raise
+        raise ValidationError({
+            api_settings.NON_FIELD_ERRORS_KEY: [REVIEW_EXISTS]
+        })
+
+
+class BulkReviewSerializer(ReviewSerializer):
+    author = serializers.CharField(source="author.username")
+
+    class Meta(ReviewSerializer.Meta):
+        list_serializer_class = BulkListSerializer
+
+    def validate_batch(self, items):
+        errors = resolve_authors(items)
+        authors = [
+            item["author"] for item, error in zip(items, errors) if not error
+        ]
+        reviewed = set(
+            Review.objects.filter(
+                title=self.context["view"].parent, author__in=authors
+            ).values_list("author_id", flat=True)
+        )
+        for item, error in zip(items, errors):
+            if error:
+                continue
+            if item["author"].id in reviewed:
+                error[api_settings.NON_FIELD_ERRORS_KEY] = [REVIEW_EXISTS]
+            reviewed.add(item["author"].id)
+        return errors
+
+    def create_batch(self, items):
+        title = self.context["view"].parent
+        try:
+            with transaction.atomic():
+                reviews = bulk_create_with_pks(Review, [
+                    Review(title=title, **item) for item in items
+                ])
+        except IntegrityError:
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [REVIEW_EXISTS]
+            })
+        change_rating(
+            title.id, sum(review.score for review in reviews), len(reviews)
+        )
+        invalidate(f"reviews:{title.id}")
+        return reviews
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -90,6 +243,24 @@ class CommentSerializer(serializers.ModelSerializer):
         )
 
 
+class BulkCommentSerializer(CommentSerializer):
+    author = serializers.CharField(source="author.username")
+
+    class Meta(CommentSerializer.Meta):
+        list_serializer_class = BulkListSerializer
+
+    def validate_batch(self, items):
+        return resolve_authors(items)
+
+    def create_batch(self, items):
+        review = self.context["view"].parent
+        comments = bulk_create_with_pks(Comment, [
+            Comment(review=review, **item) for item in items
+        ])
+        invalidate(f"comments:{review.id}")
+        return comments
+
+
 class UserSerializer(serializers.ModelSerializer, UsernameValidatorMixin):
     email = serializers.EmailField(
         max_length=settings.DEFAULT_EMAIL_LENGTH,
@@ -126,6 +297,9 @@ class RegisterDataSerializer(
     class Meta:
         model = User
         fields = ("username", "email")
+        extra_kwargs = {
+            "username": {"validators": [UnicodeUsernameValidator()]},
+        }
 
 
 class TokenSerializer(serializers.Serializer, UsernameValidatorMixin):
@@ -0,0 +1,61 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title, User)
+from reviews.ratings import rating_changed
+
+from .authentication import forget_user_state
+from .cache import invalidate
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_categories(sender, **kwargs):
+    invalidate("categories", "titles")
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_genres(sender, **kwargs):
+    invalidate("genres", "titles")
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+@receiver(post_save, sender=GenreTitle)
+@receiver(post_delete, sender=GenreTitle)
+@receiver(m2m_changed, sender=Title.genre.through)
+@receiver(rating_changed, sender=Title)
+def invalidate_titles(sender, **kwargs):
+    # Рейтинг есть на любой странице списка, где встречается произведение,
+    # поэтому сбрасывается всё пространство имён, а не отдельные title_ids.
+    invalidate("titles")
+
+
+@receiver(post_delete, sender=Title)
+def invalidate_title_reviews(sender, instance, **kwargs):
+    invalidate(f"reviews:{instance.pk}")
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_reviews(sender, instance, **kwargs):
+    invalidate(f"reviews:{instance.title_id}", f"comments:{instance.pk}")
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comments(sender, instance, **kwargs):
+    invalidate(f"comments:{instance.review_id}")
+
+
+@receiver(post_save, sender=User)
+def invalidate_authors(sender, created, **kwargs):
+    if not created:
+        invalidate("authors")
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_state(sender, instance, **kwargs):
+    forget_user_state(instance.pk)
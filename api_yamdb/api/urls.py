@@ -1,6 +1,6 @@
 from django.urls import include, path
 
-from .utils import NoPutRouter
+from .utils import NoPutRouter, async_read_view
 from .views import (
     CategoryViewSet,
     CommentViewSet,
@@ -8,7 +8,9 @@ from .views import (
     ReviewViewSet,
     TitleViewSet,
     UserViewSet,
+    export,
     get_jwt_token,
+    metrics,
     register,
 )
 
@@ -37,4 +39,8 @@ auth_urlpatterns = [
 urlpatterns = [
     path("v1/", include(router.urls)),
     path("v1/auth/", include(auth_urlpatterns)),
+    path(
+        "v1/export/<str:table>/", async_read_view(export), name="export"
+    ),
+    path("v1/metrics/", metrics, name="metrics"),
 ]
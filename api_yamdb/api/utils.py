@@ -1,19 +1,33 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage
+from django.db import close_old_connections
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.routers import DefaultRouter
+from reviews.models import ConfirmationMail
 
 
-def confirmation_mail(user):
+def confirmation_message(user, connection=None):
     confirmation_code = default_token_generator.make_token(user)
-    send_mail(
+    return EmailMessage(
         subject="YaMDb регистрация",
-        message=f"Ваш код подтверждения: {confirmation_code}",
+        body=f"Ваш код подтверждения: {confirmation_code}",
         from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
+        to=[user.email],
+        connection=connection,
     )
 
 
+def confirmation_mail(user):
+    if settings.CONFIRMATION_MAIL_QUEUE:
+        ConfirmationMail.objects.create(user=user)
+    else:
+        confirmation_message(user).send()
+
+
 class NoPutRouter(DefaultRouter):
 
     def get_method_map(self, viewset, method_map):
@@ -22,3 +36,38 @@ class NoPutRouter(DefaultRouter):
         if "put" in bound_methods.keys():
             bound_methods.pop("put", None)
         return bound_methods
+
+    def get_urls(self):
+        urls = super().get_urls()
+        if settings.ASYNC_READS:
+            for url in urls:
+                viewset = getattr(url.callback, "cls", None)
+                if getattr(viewset, "async_reads", False):
+                    url.callback = async_read_view(url.callback)
+        return urls
+
+
+def async_read_view(view):
+    # Чтение выполняется в общем пуле потоков и не занимает поток
+    # thread_sensitive, в котором Django под ASGI выполняет весь синхронный
+    # код. Запись остаётся в нём ради транзакций.
+    def read(request, *args, **kwargs):
+        close_old_connections()
+        try:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, "render"):
+                response.render()
+            return response
+        finally:
+            close_old_connections()
+
+    async_read = sync_to_async(read, thread_sensitive=False)
+    async_write = sync_to_async(view)
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return await async_read(request, *args, **kwargs)
+        return await async_write(request, *args, **kwargs)
+
+    return wrapper
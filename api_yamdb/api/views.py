@@ -1,20 +1,30 @@
 from django.contrib.auth.tokens import default_token_generator
-from django.db.models import Avg
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, Http404, StreamingHttpResponse
+from django.db.models import Prefetch, Q
 from django.db.utils import IntegrityError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, status, viewsets
-from rest_framework.decorators import action, api_view
+from rest_framework.decorators import (action, api_view,
+                                       permission_classes)
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import AccessToken
-from reviews.models import Category, Genre, Review, Title, User
+from reviews.export import (FORMATS, TABLES, export_file, export_filename,
+                            export_lines)
+from reviews.models import Category, Comment, Genre, Review, Title, User
 
+from .authentication import UserClaimsAccessToken, cache_user_state
+from .cache import CachedReadMixin, ConditionalGetMixin
 from .filters import TitleFilter
-from .mixins import CategoryAndGenreMixinViewSet
+from .metrics import report
+from .mixins import (BulkCreateMixin, CategoryAndGenreMixinViewSet,
+                     ParentObjectMixin)
+from .pagination import OptionalKeysetPagination
 from .permissions import (IsAdmin, IsAdminOrReadOnly,
                           IsAuthorOrModeratorOrAdminOrReadOnly)
-from .serializers import (CategorySerializer, CommentSerializer,
+from .serializers import (BulkCommentSerializer, BulkReviewSerializer,
+                          CategorySerializer, CommentSerializer,
                           GenreSerializer, RegisterDataSerializer,
                           ReviewSerializer, TitleReadSerializer,
                           TitleWriteSerializer, TokenSerializer,
@@ -25,81 +35,155 @@ from .utils import confirmation_mail
 class CategoryViewSet(CategoryAndGenreMixinViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    cache_namespace = "categories"
 
 
 class GenreViewSet(CategoryAndGenreMixinViewSet):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
+    cache_namespace = "genres"
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(
-        rating=Avg("reviews__score")).order_by("id")
+class TitleViewSet(ConditionalGetMixin, CachedReadMixin,
+                   viewsets.ModelViewSet):
+    queryset = (
+        Title.objects.select_related("category")
+        .prefetch_related(Prefetch("genre", queryset=Genre.objects.all()))
+        .order_by("id")
+    )
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend,)
     filterset_class = TitleFilter
+    cache_namespace = "titles"
+    etag_namespaces = ("titles",)
+    async_reads = True
 
     def get_serializer_class(self):
         if self.action in ("list", "retrieve"):
             return TitleReadSerializer
         return TitleWriteSerializer
 
+    def get_serializer(self, *args, **kwargs):
+        if self.action == "create" and isinstance(kwargs.get("data"), list):
+            kwargs["many"] = True
+        return super().get_serializer(*args, **kwargs)
+
 
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(ConditionalGetMixin, ParentObjectMixin, BulkCreateMixin,
+                    viewsets.ModelViewSet):
     serializer_class = ReviewSerializer
+    bulk_serializer_class = BulkReviewSerializer
     permission_classes = (IsAuthorOrModeratorOrAdminOrReadOnly,)
+    pagination_class = OptionalKeysetPagination
+    parent_model = Title
+    parent_field = "title"
+    parent_lookups = {"id": "title_id"}
+    etag_namespaces = ("reviews:{title_id}", "authors")
+    async_reads = True
 
     def get_queryset(self):
-        title = get_object_or_404(Title, id=self.kwargs.get("title_id"))
-        return title.reviews.all()
+        return self.filter_by_parent(
+            Review.objects.select_related("author").only(
+                "id", "text", "score", "pub_date", "title", "author__username"
+            )
+        )
 
     def perform_create(self, serializer):
-        title = get_object_or_404(Title, id=self.kwargs.get("title_id"))
         serializer.save(
-            title=title,
+            title=self.parent,
             author=self.request.user,
         )
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(ConditionalGetMixin, ParentObjectMixin, BulkCreateMixin,
+                     viewsets.ModelViewSet):
     serializer_class = CommentSerializer
+    bulk_serializer_class = BulkCommentSerializer
     permission_classes = (IsAuthorOrModeratorOrAdminOrReadOnly,)
-
-    def get_review(self):
-        return get_object_or_404(
-            Review,
-            id=self.kwargs.get("review_id"),
-            title__id=self.kwargs.get("title_id"),
-        )
+    pagination_class = OptionalKeysetPagination
+    parent_model = Review
+    parent_field = "review"
+    parent_lookups = {"id": "review_id", "title__id": "title_id"}
+    etag_namespaces = ("comments:{review_id}", "authors")
+    async_reads = True
 
     def get_queryset(self):
-        review = self.get_review()
-        return review.comments.all()
+        return self.filter_by_parent(
+            Comment.objects.select_related("author").only(
+                "id", "text", "pub_date", "review", "author__username"
+            )
+        )
 
     def perform_create(self, serializer):
-        review = self.get_review()
         serializer.save(
-            review=review,
+            review=self.parent,
             author=self.request.user,
         )
 
 
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+}
+
+
+@api_view(["GET"])
+@permission_classes((IsAdmin,))
+def export(request, table):
+    if table not in TABLES:
+        raise Http404
+    export_format = request.query_params.get("export_format", "csv")
+    if export_format not in FORMATS:
+        raise ValidationError(
+            {"export_format": [f"Допустимые форматы: {', '.join(FORMATS)}"]}
+        )
+    content_type = EXPORT_CONTENT_TYPES[export_format]
+    if isinstance(request._request, ASGIRequest):
+        # ASGIHandler в Django 3.2 перебирает тело ответа в цикле событий,
+        # где ORM недоступна, поэтому выгрузка собирается заранее во
+        # временный файл и отдаётся уже из него. В urls представление
+        # обёрнуто async_read_view: файл собирается в общем пуле потоков и
+        # не занимает поток thread_sensitive.
+        response = FileResponse(
+            export_file(table, export_format), content_type=content_type
+        )
+    else:
+        response = StreamingHttpResponse(
+            export_lines(table, export_format), content_type=content_type
+        )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export_filename(table, export_format)}"'
+    )
+    return response
+
+
+@api_view(["GET"])
+@permission_classes((IsAdmin,))
+def metrics(request):
+    return Response(report())
+
+
 @api_view(["POST"])
 def register(request):
     serializer = RegisterDataSerializer(data=request.data)
-    if User.objects.filter(
-        username=request.data.get("username"), email=request.data.get("email")
-    ).exists():
-        user_in_base = User.objects.get(
-            username=request.data.get("username"),
-            email=request.data.get("email"),
-        )
-        confirmation_mail(user_in_base)
-        return Response(request.data, status=status.HTTP_200_OK)
-    try:
-        serializer.is_valid(raise_exception=True)
-        user, _ = User.objects.get_or_create(**serializer.validated_data)
-    except IntegrityError:
+    serializer.is_valid(raise_exception=True)
+    username = serializer.validated_data["username"]
+    email = serializer.validated_data["email"]
+    users = list(
+        User.objects.filter(Q(username=username) | Q(email=email))[:2]
+    )
+    if not users:
+        try:
+            user = User.objects.create(username=username, email=email)
+        except IntegrityError:
+            raise ValidationError("Неверное имя пользователя или email")
+    elif users[0].username == username and users[0].email == email:
+        user = users[0]
+    elif any(user.username == username for user in users):
+        raise ValidationError({"username": [
+            User._meta.get_field("username").error_messages["unique"]
+        ]})
+    else:
         raise ValidationError("Неверное имя пользователя или email")
     confirmation_mail(user)
     return Response(serializer.data, status=status.HTTP_200_OK)
@@ -117,7 +201,8 @@ def get_jwt_token(request):
     if default_token_generator.check_token(
         user, serializer.validated_data.get("confirmation_code")
     ):
-        token = AccessToken.for_user(user)
+        token = UserClaimsAccessToken.for_user(user)
+        cache_user_state(user)
         return Response({"token": str(token)}, status=status.HTTP_200_OK)
 
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -139,8 +224,12 @@ class UserViewSet(viewsets.ModelViewSet):
         url_path="me",
     )
     def get_me(self, request):
+        user = request.user
+        if user._state.adding:
+            # Пользователь восстановлен из токена и содержит не все поля.
+            user = get_object_or_404(User, pk=user.pk)
         serializer = self.get_serializer(
-            request.user,
+            user,
             data=request.data,
             partial=True
         )
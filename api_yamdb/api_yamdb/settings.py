@@ -29,7 +29,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "api.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "api.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -62,11 +64,74 @@ WSGI_APPLICATION = "api_yamdb.wsgi.application"
 
 # Database
 
+DATABASE_PROFILE = os.getenv("DATABASE_PROFILE", "sqlite")
+
+DATABASE_PROFILES = {
+    "sqlite": {
+        "ENGINE": "api.backends.sqlite3",
+        "NAME": os.getenv("DB_NAME", BASE_DIR / "db.sqlite3"),
+        "CONN_MAX_AGE": int(os.getenv("CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": os.getenv("CONN_HEALTH_CHECKS", "1") == "1",
+        "OPTIONS": {
+            # Ожидание блокировки на запись, с.
+            "timeout": int(os.getenv("DB_TIMEOUT", 20)),
+        },
+    },
+    "postgresql": {
+        "ENGINE": "api.backends.postgresql",
+        "NAME": os.getenv("DB_NAME", "api_yamdb"),
+        "USER": os.getenv("POSTGRES_USER", "postgres"),
+        "PASSWORD": os.getenv("POSTGRES_PASSWORD", ""),
+        "HOST": os.getenv("DB_HOST", "localhost"),
+        "PORT": os.getenv("DB_PORT", "5432"),
+        "CONN_MAX_AGE": int(os.getenv("CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": os.getenv("CONN_HEALTH_CHECKS", "1") == "1",
+        "OPTIONS": {
+            "connect_timeout": int(os.getenv("DB_TIMEOUT", 20)),
+        },
+    },
+}
+
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+    "default": DATABASE_PROFILES[DATABASE_PROFILE],
+}
+
+# Реплики для чтения: пути к файлам SQLite или хосты PostgreSQL через запятую.
+REPLICA_SETTING = {"sqlite": "NAME", "postgresql": "HOST"}[DATABASE_PROFILE]
+REPLICA_DATABASES = []
+for number, value in enumerate(
+    filter(None, os.getenv("DB_REPLICAS", "").split(",")), start=1
+):
+    REPLICA_DATABASES.append(f"replica_{number}")
+    DATABASES[f"replica_{number}"] = {
+        **DATABASES["default"],
+        REPLICA_SETTING: value.strip(),
+        "TEST": {"MIRROR": "default"},
     }
+
+DATABASE_ROUTERS = ["api.db.ReplicaRouter"]
+
+# Сколько секунд после изменения данных ответы для кэша и ETag читаются
+# из основной базы, а не из реплики.
+REPLICA_LAG_WINDOW = int(os.getenv("DB_REPLICA_LAG_WINDOW", 5))
+
+# Количество последних замеров на маршрут для перцентилей /api/v1/metrics/.
+API_METRICS_SAMPLES = 1000
+
+# Заголовок Server-Timing раскрывает число SQL-запросов и время в базе любому
+# клиенту, поэтому по умолчанию не отдаётся. Замеры для метрик пишутся всегда.
+API_SERVER_TIMING = os.getenv("API_SERVER_TIMING", "") == "1"
+
+# Асинхронные обработчики чтения, включаются в asgi.py.
+ASYNC_READS = os.getenv("ASYNC_READS", "") == "1"
+
+# Применяются к каждому новому соединению с SQLite.
+SQLITE_PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "temp_store": "memory",
 }
 
 # Auth User Model
@@ -115,11 +180,20 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "api.authentication.StatelessJWTAuthentication",
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination." "PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 SIMPLE_JWT = {
@@ -139,3 +213,29 @@ MAX_SLUG_LENGTH = 50
 MIN_LIMIT_VALUE = 0
 MAX_LIMIT_VALUE = 10
 CHARS_LIMIT = 15
+
+# Версии пространств имён кэша должны быть общими для всех процессов:
+# с LocMemCache ETag и Last-Modified не выдаются.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "api_yamdb"),
+    }
+}
+
+API_CACHE_ALIAS = "default"
+API_CACHE_TIMEOUT = 300
+AUTH_USER_CACHE_TIMEOUT = 60
+# Время жизни карт slug -> категория/жанр в памяти процесса, с.
+SLUG_MAP_TIMEOUT = 30
+
+BULK_CREATE_MAX_ITEMS = 1000
+
+CONFIRMATION_MAIL_QUEUE = True
+CONFIRMATION_MAIL_BATCH_SIZE = 100
+CONFIRMATION_MAIL_MAX_ATTEMPTS = 5
+CONFIRMATION_MAIL_RETRY_DELAY = 30
+# Пока отправщик держит пачку, её письма не достаются другим, с.
+CONFIRMATION_MAIL_LEASE = 300
@@ -1,10 +1,10 @@
 from django.contrib import admin
 
-from .models import Category, Comment, Genre, Review, Title, User
+from .models import (Category, Comment, ConfirmationMail, Genre, Review,
+                     Title, User)
 
 admin.site.register(Category)
 admin.site.register(Genre)
-admin.site.register(Title)
 admin.site.register(Review)
 admin.site.register(Comment)
 
@@ -17,3 +17,17 @@ class UserAdmin(admin.ModelAdmin):
     list_filter = ("is_staff", "role")
     list_editable = ("is_superuser", "is_staff", "role", "email")
     empty_value_display = "-пусто-"
+
+
+@admin.register(Title)
+class TitleAdmin(admin.ModelAdmin):
+    list_display = ("pk", "name", "year", "category", "rating")
+    search_fields = ("name",)
+    readonly_fields = ("rating_sum", "rating_count")
+
+
+@admin.register(ConfirmationMail)
+class ConfirmationMailAdmin(admin.ModelAdmin):
+    list_display = ("pk", "user", "created", "next_attempt", "attempts")
+    list_filter = ("attempts",)
+    search_fields = ("user__username", "user__email")
@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+from itertools import islice
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.transaction import TransactionManagementError
+
+
+def batches(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+@contextmanager
+def keep_auto_now_add(model):
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, "auto_now_add", False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def reset_sequences(models):
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(sql)
+
+
+def bulk_create_with_pks(model, objects):
+    if not transaction.get_connection().in_atomic_block:
+        raise TransactionManagementError(
+            "bulk_create_with_pks нужно вызывать внутри transaction.atomic."
+        )
+    objects = model.objects.bulk_create(objects)
+    if not objects or objects[0].pk is not None:
+        # PostgreSQL и другие базы с RETURNING уже проставили id.
+        return objects
+    if connection.vendor != "sqlite":
+        raise ImproperlyConfigured(
+            f"bulk_create_with_pks не поддерживает {connection.vendor}: "
+            "база не вернула id из bulk_create."
+        )
+    # SQLite в Django 3.2 не возвращает id из bulk_create. Внутри
+    # транзакции база заблокирована на запись, поэтому последние
+    # len(objects) id принадлежат только что вставленным строкам.
+    pks = (
+        model.objects.order_by("-pk")
+        .values_list("pk", flat=True)[:len(objects)]
+    )
+    for obj, pk in zip(objects, reversed(list(pks))):
+        obj.pk = pk
+    return objects
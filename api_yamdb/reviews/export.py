@@ -0,0 +1,108 @@
+import csv
+from itertools import groupby
+from tempfile import SpooledTemporaryFile
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Comment, GenreTitle, Review, Title
+
+DEFAULT_CHUNK_SIZE = 2000
+# Выгрузка держится в памяти до этого размера, дальше пишется на диск.
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+FORMATS = ("csv", "ndjson")
+
+
+class Echo:
+
+    def write(self, value):
+        return value
+
+
+def title_rows(chunk_size):
+    titles = Title.objects.order_by("id").values_list(
+        "id", "name", "year", "category_id", "rating_sum", "rating_count"
+    ).iterator(chunk_size=chunk_size)
+    links = groupby(
+        GenreTitle.objects.order_by("title_id", "genre_id")
+        .values_list("title_id", "genre_id")
+        .iterator(chunk_size=chunk_size),
+        key=lambda link: link[0],
+    )
+    link_title_id, genres = next(links, (None, ()))
+    for pk, name, year, category, rating_sum, rating_count in titles:
+        while link_title_id is not None and link_title_id < pk:
+            link_title_id, genres = next(links, (None, ()))
+        genre = (
+            [genre_id for _, genre_id in genres]
+            if link_title_id == pk else []
+        )
+        rating = int(rating_sum / rating_count) if rating_count else None
+        yield pk, name, year, category, genre, rating
+
+
+def review_rows(chunk_size):
+    return Review.objects.order_by("id").values_list(
+        "id", "title_id", "text", "author_id", "score", "pub_date"
+    ).iterator(chunk_size=chunk_size)
+
+
+def comment_rows(chunk_size):
+    return Comment.objects.order_by("id").values_list(
+        "id", "review_id", "text", "author_id", "pub_date"
+    ).iterator(chunk_size=chunk_size)
+
+
+# Колонки совпадают с static/data/*.csv, чтобы выгрузку можно было
+# загрузить обратно командой import_csv.
+TABLES = {
+    "titles": (
+        "titles",
+        ("id", "name", "year", "category", "genre", "rating"),
+        title_rows,
+    ),
+    "reviews": (
+        "review",
+        ("id", "title_id", "text", "author", "score", "pub_date"),
+        review_rows,
+    ),
+    "comments": (
+        "comments",
+        ("id", "review_id", "text", "author", "pub_date"),
+        comment_rows,
+    ),
+}
+
+
+def csv_value(value, encoder):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    if isinstance(value, (int, str)):
+        return value
+    return encoder.default(value)
+
+
+def export_lines(table, export_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    _, columns, rows = TABLES[table]
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    if export_format == "ndjson":
+        for row in rows(chunk_size):
+            yield encoder.encode(dict(zip(columns, row))) + "\n"
+        return
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    for row in rows(chunk_size):
+        yield writer.writerow([csv_value(value, encoder) for value in row])
+
+
+def export_file(table, export_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    export = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    for line in export_lines(table, export_format, chunk_size):
+        export.write(line.encode())
+    export.seek(0)
+    return export
+
+
+def export_filename(table, export_format):
+    return f"{TABLES[table][0]}.{export_format}"
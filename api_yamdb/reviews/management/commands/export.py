@@ -0,0 +1,63 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews.export import (DEFAULT_CHUNK_SIZE, FORMATS, TABLES,
+                            export_filename, export_lines)
+
+
+class Command(BaseCommand):
+    help = "Выгружает произведения, отзывы и комментарии в csv или ndjson"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "tables",
+            nargs="*",
+            help=f"Таблицы ({', '.join(TABLES)}), по умолчанию все",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default="csv",
+            help="Формат выгрузки",
+        )
+        parser.add_argument(
+            "--path",
+            help="Каталог для файлов; без него выгрузка пишется в stdout",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Количество строк, читаемых из базы за один раз",
+        )
+
+    def handle(self, *args, **options):
+        tables = options["tables"] or list(TABLES)
+        unknown = set(tables) - set(TABLES)
+        if unknown:
+            raise CommandError(
+                f"Неизвестные таблицы: {', '.join(sorted(unknown))}"
+            )
+        export_format = options["format"]
+        if options["path"] is None:
+            if export_format == "csv" and len(tables) > 1:
+                raise CommandError(
+                    "Для выгрузки нескольких таблиц в csv укажите --path"
+                )
+            for table in tables:
+                for line in export_lines(
+                    table, export_format, options["chunk_size"]
+                ):
+                    self.stdout.write(line, ending="")
+            return
+        os.makedirs(options["path"], exist_ok=True)
+        for table in tables:
+            path = os.path.join(
+                options["path"], export_filename(table, export_format)
+            )
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.writelines(
+                    export_lines(table, export_format, options["chunk_size"])
+                )
+            self.stdout.write(f"{table}: {path}")
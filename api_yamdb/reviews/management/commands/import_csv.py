@@ -0,0 +1,158 @@
+import csv
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from reviews.bulk import batches, keep_auto_now_add, reset_sequences
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title, User)
+from reviews.ratings import rebuild_ratings
+
+DEFAULT_DATA_DIR = settings.BASE_DIR / "static" / "data"
+DEFAULT_BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Загружает данные из csv файлов static/data в базу данных"
+
+    tables = (
+        ("users.csv", User, "build_user"),
+        ("category.csv", Category, "build_category"),
+        ("genre.csv", Genre, "build_genre"),
+        ("titles.csv", Title, "build_title"),
+        ("genre_title.csv", GenreTitle, "build_genre_title"),
+        ("review.csv", Review, "build_review"),
+        ("comments.csv", Comment, "build_comment"),
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=DEFAULT_DATA_DIR,
+            help="Каталог с csv файлами",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Количество строк в одном bulk_create",
+        )
+
+    def handle(self, *args, **options):
+        self.ids = {
+            model: set(model.objects.values_list("pk", flat=True).iterator())
+            for model in (User, Category, Genre, Title, Review)
+        }
+        for filename, model, builder in self.tables:
+            self.import_file(
+                f"{options['path']}/{filename}",
+                model,
+                getattr(self, builder),
+                options["batch_size"],
+            )
+        reset_sequences([model for _, model, _ in self.tables])
+        with transaction.atomic():
+            rebuild_ratings()
+
+    def read_rows(self, path):
+        with open(path, encoding="utf-8", newline="") as csv_file:
+            yield from csv.DictReader(csv_file)
+
+    def import_file(self, path, model, builder, batch_size):
+        started = time.perf_counter()
+        imported = skipped = 0
+        objects = (builder(row) for row in self.read_rows(path))
+        with transaction.atomic(), keep_auto_now_add(model):
+            for rows in batches(objects, batch_size):
+                batch = [obj for obj in rows if obj is not None]
+                skipped += len(rows) - len(batch)
+                model.objects.bulk_create(batch)
+                imported += len(batch)
+                if model in self.ids:
+                    self.ids[model].update(obj.pk for obj in batch)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{model._meta.db_table}: {imported} строк за {elapsed:.2f} с "
+            f"({imported / elapsed if elapsed else 0:.0f} строк/с)"
+        )
+        if skipped:
+            self.stdout.write(self.style.WARNING(
+                f"{model._meta.db_table}: пропущено {skipped} строк "
+                f"с несуществующими связями"
+            ))
+
+    def resolve(self, model, pk):
+        pk = int(pk)
+        return pk if pk in self.ids[model] else None
+
+    def build_user(self, row):
+        return User(
+            id=int(row["id"]),
+            username=row["username"],
+            email=row["email"],
+            role=row["role"] or User.USER,
+            bio=row["bio"],
+            first_name=row["first_name"],
+            last_name=row["last_name"],
+            password=make_password(None),
+        )
+
+    def build_category(self, row):
+        return Category(id=int(row["id"]), name=row["name"], slug=row["slug"])
+
+    def build_genre(self, row):
+        return Genre(id=int(row["id"]), name=row["name"], slug=row["slug"])
+
+    def build_title(self, row):
+        return Title(
+            id=int(row["id"]),
+            name=row["name"],
+            year=row["year"],
+            description=row.get("description", ""),
+            category_id=(
+                self.resolve(Category, row["category"])
+                if row["category"] else None
+            ),
+        )
+
+    def build_genre_title(self, row):
+        title_id = self.resolve(Title, row["title_id"])
+        genre_id = self.resolve(Genre, row["genre_id"])
+        if title_id is None or genre_id is None:
+            return None
+        return GenreTitle(
+            id=int(row["id"]),
+            title_id=title_id,
+            genre_id=genre_id,
+        )
+
+    def build_review(self, row):
+        title_id = self.resolve(Title, row["title_id"])
+        author_id = self.resolve(User, row["author"])
+        if title_id is None or author_id is None:
+            return None
+        return Review(
+            id=int(row["id"]),
+            title_id=title_id,
+            author_id=author_id,
+            text=row["text"],
+            score=row["score"],
+            pub_date=parse_datetime(row["pub_date"]),
+        )
+
+    def build_comment(self, row):
+        review_id = self.resolve(Review, row["review_id"])
+        author_id = self.resolve(User, row["author"])
+        if review_id is None or author_id is None:
+            return None
+        return Comment(
+            id=int(row["id"]),
+            review_id=review_id,
+            author_id=author_id,
+            text=row["text"],
+            pub_date=parse_datetime(row["pub_date"]),
+        )
@@ -0,0 +1,31 @@
+# Generated by Django 3.2 on 2026-10-18 19:16
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_links(apps, schema_editor):
+    GenreTitle = apps.get_model('reviews', 'GenreTitle')
+    keep = (
+        GenreTitle.objects.values('genre', 'title')
+        .annotate(keep_id=Min('id'))
+        .values('keep_id')
+    )
+    GenreTitle.objects.exclude(id__in=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_links, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='genretitle',
+            constraint=models.UniqueConstraint(fields=('genre', 'title'), name='unique_genre_title'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 3.2 on 2026-10-18 21:40
+
+import sqlite3
+
+from django.db import migrations
+
+SQLITE_FORWARDS = (
+    """
+    CREATE VIRTUAL TABLE reviews_title_search USING fts5(
+        name, content='reviews_title', content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER reviews_title_search_insert AFTER INSERT ON reviews_title
+    BEGIN
+        INSERT INTO reviews_title_search(rowid, name)
+        VALUES (new.id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER reviews_title_search_delete AFTER DELETE ON reviews_title
+    BEGIN
+        INSERT INTO reviews_title_search(reviews_title_search, rowid, name)
+        VALUES ('delete', old.id, old.name);
+    END
+    """,
+    """
+    CREATE TRIGGER reviews_title_search_update
+    AFTER UPDATE OF name ON reviews_title
+    BEGIN
+        INSERT INTO reviews_title_search(reviews_title_search, rowid, name)
+        VALUES ('delete', old.id, old.name);
+        INSERT INTO reviews_title_search(rowid, name)
+        VALUES (new.id, new.name);
+    END
+    """,
+    "INSERT INTO reviews_title_search(reviews_title_search) VALUES ('rebuild')",
+)
+SQLITE_BACKWARDS = (
+    "DROP TRIGGER IF EXISTS reviews_title_search_update",
+    "DROP TRIGGER IF EXISTS reviews_title_search_delete",
+    "DROP TRIGGER IF EXISTS reviews_title_search_insert",
+    "DROP TABLE IF EXISTS reviews_title_search",
+)
+POSTGRESQL_FORWARDS = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    CREATE INDEX IF NOT EXISTS reviews_title_name_trgm
+    ON reviews_title USING gin (UPPER(name::text) gin_trgm_ops)
+    """,
+)
+POSTGRESQL_BACKWARDS = (
+    "DROP INDEX IF EXISTS reviews_title_name_trgm",
+)
+
+
+def statements(schema_editor, sqlite, postgresql):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite' and sqlite3.sqlite_version_info >= (3, 34):
+        return sqlite
+    if vendor == 'postgresql':
+        return postgresql
+    return ()
+
+
+def create_search_index(apps, schema_editor):
+    for sql in statements(
+        schema_editor, SQLITE_FORWARDS, POSTGRESQL_FORWARDS
+    ):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    for sql in statements(
+        schema_editor, SQLITE_BACKWARDS, POSTGRESQL_BACKWARDS
+    ):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_confirmation_mail'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-10-18 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_title_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='confirmationmail',
+            name='lease',
+            field=models.UUIDField(blank=True, db_index=True, null=True, verbose_name='Захвачено отправщиком'),
+        ),
+    ]
@@ -1,7 +1,8 @@
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, router, transaction
+from django.utils import timezone
 
 from .validators import UsernameValidatorMixin, validate_year
 
@@ -38,6 +39,15 @@ class User(AbstractUser, UsernameValidatorMixin):
     def __str__(self):
         return self.username
 
+    def delete(self, *args, **kwargs):
+        from .ratings import batch_rating_changes
+        using = kwargs.get("using") or router.db_for_write(
+            User, instance=self
+        )
+        with transaction.atomic(using=using):
+            with batch_rating_changes():
+                return super().delete(*args, **kwargs)
+
     @property
     def is_moderator(self):
         return self.role == self.MODERATOR
@@ -118,6 +128,14 @@ class Title(models.Model):
         null=True,
         verbose_name="Категория",
     )
+    rating_sum = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Сумма оценок",
+    )
+    rating_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Количество оценок",
+    )
 
     class Meta:
         verbose_name = "Произведение"
@@ -127,6 +145,25 @@ class Title(models.Model):
     def __str__(self):
         return self.name
 
+    def delete(self, *args, **kwargs):
+        from .ratings import batch_rating_changes
+        using = kwargs.get("using") or router.db_for_write(
+            Title, instance=self
+        )
+        pk = self.pk
+        with transaction.atomic(using=using):
+            with batch_rating_changes() as changes:
+                deleted = super().delete(*args, **kwargs)
+                # Рейтинг удалённого произведения пересчитывать незачем.
+                changes.pop(pk, None)
+        return deleted
+
+    @property
+    def rating(self):
+        if not self.rating_count:
+            return None
+        return self.rating_sum / self.rating_count
+
 
 class GenreTitle(models.Model):
     title = models.ForeignKey(
@@ -140,6 +177,14 @@ class GenreTitle(models.Model):
         verbose_name="Название жанра",
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["genre", "title"],
+                name="unique_genre_title"
+            )
+        ]
+
 
 class Review(models.Model):
     title = models.ForeignKey(
@@ -176,11 +221,31 @@ class Review(models.Model):
                 name="unique_review"
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["title", "pub_date", "id"],
+                name="review_title_pub_date_idx",
+            )
+        ]
         ordering = ("pub_date",)
 
     def __str__(self):
         return self.text[: settings.CHARS_LIMIT]
 
+    def save(self, *args, **kwargs):
+        # Отзыв и рейтинг произведения фиксируются одной транзакцией.
+        using = kwargs.get("using") or router.db_for_write(
+            Review, instance=self
+        )
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_score = dict(zip(field_names, values)).get("score")
+        return instance
+
 
 class Comment(models.Model):
     review = models.ForeignKey(
@@ -206,7 +271,53 @@ class Comment(models.Model):
     class Meta:
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
+        indexes = [
+            models.Index(
+                fields=["review", "pub_date", "id"],
+                name="comment_review_pub_date_idx",
+            )
+        ]
         ordering = ("pub_date",)
 
     def __str__(self):
         return self.text[: settings.CHARS_LIMIT]
+
+
+class ConfirmationMail(models.Model):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="confirmation_mails",
+        verbose_name="Пользователь",
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name="Дата создания",
+    )
+    next_attempt = models.DateTimeField(
+        default=timezone.now,
+        db_index=True,
+        verbose_name="Следующая попытка",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name="Количество попыток",
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name="Последняя ошибка",
+    )
+    lease = models.UUIDField(
+        null=True,
+        blank=True,
+        db_index=True,
+        verbose_name="Захвачено отправщиком",
+    )
+
+    class Meta:
+        verbose_name = "Письмо с кодом подтверждения"
+        verbose_name_plural = "Письма с кодом подтверждения"
+        ordering = ("next_attempt",)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.attempts}"
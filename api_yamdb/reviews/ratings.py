@@ -0,0 +1,73 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.dispatch import Signal
+
+from .models import Review, Title
+
+rating_changed = Signal()
+pending_changes = ContextVar("pending_rating_changes", default=None)
+
+
+def change_rating(title_id, score_delta, count_delta):
+    changes = pending_changes.get()
+    if changes is not None:
+        changes[title_id][0] += score_delta
+        changes[title_id][1] += count_delta
+        return
+    Title.objects.filter(pk=title_id).update(
+        rating_sum=F("rating_sum") + score_delta,
+        rating_count=F("rating_count") + count_delta,
+    )
+    rating_changed.send(sender=Title, title_ids=[title_id])
+
+
+@contextmanager
+def batch_rating_changes():
+    # Каскадное удаление присылает post_delete на каждый отзыв: изменения
+    # копятся по произведениям и применяются одним UPDATE на каждое.
+    if pending_changes.get() is not None:
+        yield pending_changes.get()
+        return
+    changes = defaultdict(lambda: [0, 0])
+    token = pending_changes.set(changes)
+    try:
+        yield changes
+    finally:
+        pending_changes.reset(token)
+    changes = {
+        title_id: deltas for title_id, deltas in changes.items()
+        if any(deltas)
+    }
+    for title_id, (score_delta, count_delta) in changes.items():
+        Title.objects.filter(pk=title_id).update(
+            rating_sum=F("rating_sum") + score_delta,
+            rating_count=F("rating_count") + count_delta,
+        )
+    if changes:
+        rating_changed.send(sender=Title, title_ids=list(changes))
+
+
+def rebuild_ratings(titles=None):
+    if titles is None:
+        titles = Title.objects.all()
+    reviews = (
+        Review.objects.filter(title=OuterRef("pk"))
+        .order_by()
+        .values("title")
+    )
+    updated = titles.update(
+        rating_sum=Coalesce(
+            Subquery(reviews.annotate(total=Sum("score")).values("total")),
+            0,
+        ),
+        rating_count=Coalesce(
+            Subquery(reviews.annotate(total=Count("pk")).values("total")),
+            0,
+        ),
+    )
+    rating_changed.send(sender=Title, title_ids=None)
+    return updated
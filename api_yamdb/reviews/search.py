@@ -0,0 +1,126 @@
+from django.db import connections
+from django.db.models import F
+from django.db.models.expressions import RawSQL
+
+SQLITE_INDEX = "reviews_title_search"
+SQLITE_MATCH = (
+    f"SELECT rowid FROM {SQLITE_INDEX} WHERE {SQLITE_INDEX} MATCH %s"
+)
+SQLITE_RANK = (
+    f"SELECT rank FROM {SQLITE_INDEX} "
+    f"WHERE {SQLITE_INDEX} MATCH %s AND rowid = {{table}}.id"
+)
+SQLITE_TRIGGERS = {
+    "reviews_title_search_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS reviews_title_search_insert
+        AFTER INSERT ON reviews_title
+        BEGIN
+            INSERT INTO {SQLITE_INDEX}(rowid, name)
+            VALUES (new.id, new.name);
+        END
+    """,
+    "reviews_title_search_delete": f"""
+        CREATE TRIGGER IF NOT EXISTS reviews_title_search_delete
+        AFTER DELETE ON reviews_title
+        BEGIN
+            INSERT INTO {SQLITE_INDEX}({SQLITE_INDEX}, rowid, name)
+            VALUES ('delete', old.id, old.name);
+        END
+    """,
+    "reviews_title_search_update": f"""
+        CREATE TRIGGER IF NOT EXISTS reviews_title_search_update
+        AFTER UPDATE OF name ON reviews_title
+        BEGIN
+            INSERT INTO {SQLITE_INDEX}({SQLITE_INDEX}, rowid, name)
+            VALUES ('delete', old.id, old.name);
+            INSERT INTO {SQLITE_INDEX}(rowid, name)
+            VALUES (new.id, new.name);
+        END
+    """,
+}
+SQLITE_REBUILD = (
+    f"INSERT INTO {SQLITE_INDEX}({SQLITE_INDEX}) VALUES ('rebuild')"
+)
+# Триграммный индекс не находит подстроки короче трёх символов.
+MIN_TERM_LENGTH = 3
+# Готов ли индекс в базе: миграция 0007 пропускает его на старом SQLite.
+_has_index = {}
+
+
+def search_objects(connection):
+    names = [SQLITE_INDEX, *SQLITE_TRIGGERS]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name IN ({})".format(
+                ", ".join(["%s"] * len(names))
+            ),
+            names,
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def restore_search_triggers(using):
+    # SQLite пересоздаёт таблицу при AddField/AlterField, и триггеры
+    # reviews_title пропадают вместе со старой таблицей.
+    connection = connections[using]
+    _has_index.clear()
+    if connection.vendor != "sqlite":
+        return
+    existing = search_objects(connection)
+    if SQLITE_INDEX not in existing:
+        return
+    missing = [name for name in SQLITE_TRIGGERS if name not in existing]
+    if not missing:
+        return
+    with connection.cursor() as cursor:
+        for name in missing:
+            cursor.execute(SQLITE_TRIGGERS[name])
+        # Пока триггеров не было, индекс не видел новых названий.
+        cursor.execute(SQLITE_REBUILD)
+
+
+def use_fts(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor != "sqlite":
+        return False
+    key = (queryset.db, connection.settings_dict["NAME"])
+    if key not in _has_index:
+        # Без любого из триггеров индекс отстаёт от reviews_title.
+        _has_index[key] = search_objects(connection) == {
+            SQLITE_INDEX, *SQLITE_TRIGGERS
+        }
+    return _has_index[key]
+
+
+def phrase(term):
+    return '"{}"'.format(term.replace('"', '""'))
+
+
+def filter_by_name(queryset, value):
+    if not use_fts(queryset) or len(value) < MIN_TERM_LENGTH:
+        return queryset.filter(name__icontains=value)
+    return queryset.filter(id__in=RawSQL(SQLITE_MATCH, [phrase(value)]))
+
+
+def search(queryset, value):
+    terms = value.split()
+    indexed = [term for term in terms if len(term) >= MIN_TERM_LENGTH]
+    if not use_fts(queryset):
+        indexed = []
+    for term in terms:
+        if term not in indexed:
+            queryset = queryset.filter(name__icontains=term)
+    if indexed:
+        query = " ".join(phrase(term) for term in indexed)
+        rank = SQLITE_RANK.format(table=queryset.model._meta.db_table)
+        return queryset.filter(
+            id__in=RawSQL(SQLITE_MATCH, [query])
+        ).annotate(
+            search_rank=RawSQL(rank, [query])
+        ).order_by("search_rank", "id")
+    if connections[queryset.db].vendor == "postgresql":
+        from django.contrib.postgres.search import TrigramSimilarity
+        return queryset.annotate(
+            search_rank=TrigramSimilarity("name", value)
+        ).order_by(F("search_rank").desc(), "id")
+    return queryset
@@ -0,0 +1,50 @@
+from django.db.models.signals import (post_delete, post_migrate, post_save,
+                                      pre_save)
+from django.dispatch import receiver
+
+from .models import Review, Title
+from .ratings import change_rating, rebuild_ratings
+from .search import restore_search_triggers
+
+
+@receiver(pre_save, sender=Review)
+def lock_loaded_score(sender, instance, raw, using, update_fields, **kwargs):
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and "score" not in update_fields:
+        return
+    # Оценка, прочитанная при загрузке, могла устареть: параллельные
+    # изменения отзыва посчитали бы разницу от одного и того же значения.
+    # Review.save идёт в транзакции, строка блокируется до её конца.
+    instance._loaded_score = (
+        Review.objects.using(using).select_for_update()
+        .filter(pk=instance.pk).values_list("score", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Review)
+def update_rating_on_save(sender, instance, created, raw, **kwargs):
+    if raw:
+        return
+    loaded_score = getattr(instance, "_loaded_score", None)
+    if created:
+        change_rating(instance.title_id, instance.score, 1)
+    elif loaded_score is None:
+        rebuild_ratings(Title.objects.filter(pk=instance.title_id))
+    elif loaded_score != instance.score:
+        change_rating(instance.title_id, instance.score - loaded_score, 0)
+    instance._loaded_score = instance.score
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_delete(sender, instance, **kwargs):
+    score = getattr(instance, "_loaded_score", None)
+    if score is None:
+        score = instance.score
+    change_rating(instance.title_id, -score, -1)
+
+
+@receiver(post_migrate)
+def restore_search_index(sender, using, **kwargs):
+    if sender.label == "reviews":
+        restore_search_triggers(using)
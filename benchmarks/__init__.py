@@ -0,0 +1,13 @@
+import os
+import sys
+from pathlib import Path
+
+import django
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent / "api_yamdb"
+
+# Бенчмарки запускаются как `python -m benchmarks.<name>` из корня
+# репозитория, поэтому Django настраивается при импорте пакета.
+sys.path.insert(0, str(PROJECT_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api_yamdb.settings")
+django.setup()
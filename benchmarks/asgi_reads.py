@@ -0,0 +1,216 @@
+import argparse
+import asyncio
+import importlib
+import io
+import json
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.db.backends.signals import connection_created
+from django.test import override_settings
+from django.urls import clear_url_caches
+from reviews.models import Review
+
+from benchmarks.database import benchmark_database
+from benchmarks.seed import seed
+
+# Размер пула потоков WSGI-сервера и пула sync_to_async под ASGI.
+THREADS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def reload_urls():
+    for module in ("api.urls", "api_yamdb.urls"):
+        importlib.reload(importlib.import_module(module))
+    clear_url_caches()
+
+
+def build_paths(count):
+    reviews = list(Review.objects.values_list("title_id", "id"))
+    paths = []
+    for _ in range(count):
+        title_id, review_id = random.choice(reviews)
+        paths.append(random.choice((
+            f"/api/v1/titles/{title_id}/",
+            f"/api/v1/titles/{title_id}/reviews/",
+            f"/api/v1/titles/{title_id}/reviews/{review_id}/comments/",
+        )))
+    return paths
+
+
+def add_query_latency(latency):
+    # Сетевая задержка до сервера БД, которой нет у локального SQLite.
+    def execute(execute, sql, params, many, context):
+        time.sleep(latency)
+        return execute(sql, params, many, context)
+
+    def on_connection_created(sender, connection, **kwargs):
+        if execute not in connection.execute_wrappers:
+            connection.execute_wrappers.append(execute)
+
+    connection_created.connect(on_connection_created, weak=False)
+
+
+def split(paths, connections):
+    return [paths[index::connections] for index in range(connections)]
+
+
+def run_wsgi(paths, options):
+    handler = WSGIHandler()
+    delay = options.client_delay / 1000
+
+    # Медленный клиент держит поток сервера, пока передаёт запрос
+    # и принимает ответ.
+    def serve(path):
+        time.sleep(delay)
+        statuses = []
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "localhost",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(),
+        }
+        response = handler(environ, lambda status, headers: statuses.append(
+            status
+        ))
+        try:
+            for _ in response:
+                time.sleep(delay)
+        finally:
+            response.close()
+        return statuses[0].startswith("200")
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return sum(executor.map(serve, paths))
+
+
+def run_asgi(paths, options):
+    handler = ASGIHandler()
+    delay = options.client_delay / 1000
+
+    async def serve(path):
+        statuses = []
+
+        async def receive():
+            await asyncio.sleep(delay)
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+            else:
+                await asyncio.sleep(delay)
+
+        await handler({
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "query_string": b"",
+            "headers": [(b"host", b"localhost")],
+            "server": ("localhost", 80),
+        }, receive, send)
+        return statuses[0] == 200
+
+    async def connection(paths):
+        return [await serve(path) for path in paths]
+
+    async def main():
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(THREADS)
+        )
+        results = await asyncio.gather(*(
+            connection(paths)
+            for paths in split(paths, options.connections)
+        ))
+        return sum(sum(result) for result in results)
+
+    return asyncio.run(main())
+
+
+SERVERS = (
+    ("wsgi", run_wsgi, False),
+    ("asgi_sync_views", run_asgi, False),
+    ("asgi_async_reads", run_asgi, True),
+)
+
+
+def measure(server, paths, options):
+    started = time.perf_counter()
+    succeeded = server(paths, options)
+    elapsed = time.perf_counter() - started
+    return {
+        "requests_per_second": round(len(paths) / elapsed, 1),
+        "succeeded": succeeded,
+        "seconds": round(elapsed, 2),
+    }
+
+
+def run(options):
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        with benchmark_database(
+            test_name=os.path.join(directory, "benchmark.sqlite3")
+        ):
+            seed(
+                titles=options.titles,
+                reviews=options.titles * 20,
+                comments=options.titles * 20,
+            )
+            paths = build_paths(options.connections * options.requests)
+            add_query_latency(options.query_latency / 1000)
+            for name, server, async_reads in SERVERS:
+                with override_settings(ASYNC_READS=async_reads):
+                    reload_urls()
+                    report[name] = measure(server, paths, options)
+            reload_urls()
+    return {
+        "connections": options.connections,
+        "requests": len(paths),
+        "client_delay_ms": options.client_delay,
+        "query_latency_ms": options.query_latency,
+        "threads": THREADS,
+        "servers": report,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Пропускная способность чтения под WSGI и ASGI"
+    )
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--client-delay", type=float, default=20)
+    parser.add_argument("--query-latency", type=float, default=1)
+    parser.add_argument("--titles", type=int, default=100)
+    parser.add_argument("--json", action="store_true")
+    options = parser.parse_args()
+    report = run(options)
+    if options.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    print(
+        f"{report['connections']} соединений, {report['requests']} запросов, "
+        f"задержка клиента {report['client_delay_ms']} мс, "
+        f"задержка запроса к БД {report['query_latency_ms']} мс, "
+        f"{report['threads']} потоков"
+    )
+    for name, result in report["servers"].items():
+        print(
+            f"{name}: {result['requests_per_second']} запросов/с, "
+            f"успешно {result['succeeded']} за {result['seconds']} с"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from itertools import count
+
+from django.conf import settings
+from django.db import OperationalError, connection
+from django.test import override_settings
+from reviews.models import Comment, Review
+
+from benchmarks.database import benchmark_database
+from benchmarks.seed import seed
+
+# Настройки до появления профилей: журнал отката, новое соединение на
+# каждый запрос и стандартное ожидание блокировки sqlite3 в 5 с.
+PROFILES = {
+    "defaults": {
+        "pragmas": {"journal_mode": "delete", "synchronous": "full"},
+        "timeout": 5,
+        "persistent": False,
+    },
+    "tuned": {
+        "pragmas": settings.SQLITE_PRAGMAS,
+        "timeout": settings.DATABASE_PROFILES["sqlite"]["OPTIONS"]["timeout"],
+        "persistent": True,
+    },
+}
+
+
+def write_comment(review_ids, sequence):
+    review_id = review_ids[next(sequence) % len(review_ids)]
+    if Review.objects.filter(pk=review_id).exists():
+        Comment.objects.create(
+            review_id=review_id, author_id=1, text="Комментарий"
+        )
+
+
+def writer(review_ids, sequence, deadline, persistent, results):
+    done = failed = 0
+    try:
+        while time.perf_counter() < deadline:
+            try:
+                write_comment(review_ids, sequence)
+                done += 1
+            except OperationalError:
+                failed += 1
+            if not persistent:
+                connection.close()
+    finally:
+        connection.close()
+        results.append((done, failed))
+
+
+def measure(profile, review_ids, writers, seconds):
+    connection.settings_dict["OPTIONS"]["timeout"] = profile["timeout"]
+    connection.close()
+    with override_settings(SQLITE_PRAGMAS=profile["pragmas"]):
+        connection.ensure_connection()
+        results = []
+        sequence = count()
+        deadline = time.perf_counter() + seconds
+        threads = [
+            threading.Thread(
+                target=writer,
+                args=(review_ids, sequence, deadline,
+                      profile["persistent"], results),
+            )
+            for _ in range(writers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        connection.close()
+    done = sum(result[0] for result in results)
+    return {
+        "writes_per_second": round(done / seconds),
+        "writes": done,
+        "locked_errors": sum(result[1] for result in results),
+    }
+
+
+def run(options):
+    with tempfile.TemporaryDirectory() as directory:
+        with benchmark_database(
+            test_name=os.path.join(directory, "benchmark.sqlite3")
+        ):
+            if connection.vendor != "sqlite":
+                raise SystemExit("Бенчмарк рассчитан на профиль sqlite")
+            seed(titles=100, reviews=1000, comments=0)
+            review_ids = list(Review.objects.values_list("id", flat=True))
+            report = {
+                name: measure(
+                    profile, review_ids, options.writers, options.seconds
+                )
+                for name, profile in PROFILES.items()
+            }
+    return {"writers": options.writers, "profiles": report}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Пропускная способность SQLite при конкурентной записи"
+    )
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--json", action="store_true")
+    options = parser.parse_args()
+    report = run(options)
+    if options.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    print(f"{report['writers']} пишущих потоков")
+    for name, result in report["profiles"].items():
+        print(
+            f"{name}: {result['writes_per_second']} записей/с, "
+            f"всего {result['writes']}, "
+            f"ошибок блокировки {result['locked_errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+from contextlib import contextmanager
+
+from django.db import connection
+
+
+@contextmanager
+def benchmark_database(keepdb=False, test_name=None):
+    old_name = connection.settings_dict["NAME"]
+    if test_name is not None:
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = test_name
+    connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False, keepdb=keepdb
+    )
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(
+            old_name, verbosity=0, keepdb=keepdb
+        )
+
+
+def analyze():
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
@@ -0,0 +1,186 @@
+import argparse
+import json
+import subprocess
+import time
+import tracemalloc
+from collections import namedtuple
+
+from django.contrib.auth.tokens import default_token_generator
+from django.test.utils import override_settings
+from reviews.models import User
+from rest_framework.test import APIClient
+
+from api.authentication import UserClaimsAccessToken
+from api.metrics import percentile
+from benchmarks.database import analyze, benchmark_database
+from benchmarks.seed import DATA_DIR, scaled_dataset, seed
+
+Endpoint = namedtuple("Endpoint", ("name", "method", "path", "data", "client"))
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "--short", "HEAD"),
+            capture_output=True, check=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def query_count(response):
+    timing = response.get("Server-Timing", "")
+    for entry in timing.split(", "):
+        if entry.startswith("db;"):
+            return int(entry.split('desc="', 1)[1].split(" ", 1)[0])
+    return None
+
+
+def build_endpoints(dataset):
+    titles = dataset["titles"]
+    user = User.objects.create(
+        username="benchmark", email="benchmark@yamdb.fake"
+    )
+    reader = APIClient()
+    reader.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {UserClaimsAccessToken.for_user(user)}"
+    )
+    anonymous = APIClient()
+    code = default_token_generator.make_token(user)
+    # Первый отзыв относится к первому произведению, и у него есть
+    # комментарии.
+    comments = "/api/v1/titles/1/reviews/1/comments/"
+    filters = {
+        "category": "category-1",
+        "genre": "genre-1",
+        "year": "1901",
+        "name": "Произведение 1",
+        "search": "Произведение 12",
+    }
+    return [
+        Endpoint("titles_list", "get", lambda i: "/api/v1/titles/",
+                 None, reader),
+        *(
+            Endpoint(
+                f"titles_list_{field}", "get",
+                lambda i, query=f"?{field}={value}": (
+                    f"/api/v1/titles/{query}"
+                ),
+                None, reader,
+            )
+            for field, value in filters.items()
+        ),
+        Endpoint("title_retrieve", "get",
+                 lambda i: f"/api/v1/titles/{i % titles + 1}/", None, reader),
+        Endpoint("reviews_list", "get",
+                 lambda i: f"/api/v1/titles/{i % titles + 1}/reviews/",
+                 None, reader),
+        # Один автор может оставить только один отзыв на произведение.
+        Endpoint("reviews_create", "post",
+                 lambda i: f"/api/v1/titles/{i + 1}/reviews/",
+                 lambda i: {"text": f"Отзыв {i}", "score": i % 11}, reader),
+        Endpoint("comments_list", "get", lambda i: comments, None, reader),
+        Endpoint("comments_create", "post", lambda i: comments,
+                 lambda i: {"text": f"Комментарий {i}"}, reader),
+        Endpoint("signup", "post", lambda i: "/api/v1/auth/signup/",
+                 lambda i: {"username": f"signup{i}",
+                            "email": f"signup{i}@yamdb.fake"},
+                 anonymous),
+        Endpoint("token", "post", lambda i: "/api/v1/auth/token/",
+                 lambda i: {"username": user.username,
+                            "confirmation_code": code},
+                 anonymous),
+    ]
+
+
+def call(endpoint, i):
+    request = getattr(endpoint.client, endpoint.method)
+    data = endpoint.data(i) if endpoint.data else None
+    response = request(endpoint.path(i), data, format="json")
+    if response.status_code >= 400:
+        raise RuntimeError(
+            f"{endpoint.name}: {response.status_code} {response.content!r}"
+        )
+    return response
+
+
+def measure(endpoint, requests):
+    call(endpoint, 0)
+    timings = []
+    queries = []
+    started = time.perf_counter()
+    for i in range(1, requests + 1):
+        request_started = time.perf_counter()
+        response = call(endpoint, i)
+        timings.append((time.perf_counter() - request_started) * 1000)
+        queries.append(query_count(response))
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    call(endpoint, requests + 1)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "requests_per_second": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "queries": percentile(queries, 50),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def run(options):
+    dataset = scaled_dataset(options.scale)
+    for table in ("users", "titles", "genres", "reviews", "comments"):
+        if getattr(options, table) is not None:
+            dataset[table] = getattr(options, table)
+    requests = min(options.requests, dataset["titles"] - 2)
+    # Число SQL-запросов берётся из заголовка Server-Timing.
+    with benchmark_database(), override_settings(API_SERVER_TIMING=True):
+        dataset = seed(**dataset)
+        analyze()
+        endpoints = build_endpoints(dataset)
+        report = {
+            endpoint.name: measure(endpoint, requests)
+            for endpoint in endpoints
+            if options.only is None or endpoint.name in options.only
+        }
+    return {
+        "commit": current_commit(),
+        "dataset": dataset,
+        "requests": requests,
+        "endpoints": report,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Производительность основных эндпоинтов на синтетических данных "
+            f"в пропорциях {DATA_DIR}"
+        )
+    )
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--titles", type=int)
+    parser.add_argument("--genres", type=int)
+    parser.add_argument("--reviews", type=int)
+    parser.add_argument("--comments", type=int)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--only", nargs="+", help="Имена эндпоинтов")
+    parser.add_argument("--json", action="store_true")
+    options = parser.parse_args()
+    report = run(options)
+    if options.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    print(f"{report['commit']}: {report['dataset']}")
+    for name, result in report["endpoints"].items():
+        print(
+            f"{name}: {result['requests_per_second']} запросов/с, "
+            f"p50 {result['p50_ms']} мс, p95 {result['p95_ms']} мс, "
+            f"{result['queries']} SQL, {result['peak_memory_kib']} КиБ"
+        )
+
+
+if __name__ == "__main__":
+    main()
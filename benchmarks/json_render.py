@@ -0,0 +1,92 @@
+import argparse
+import json
+import statistics
+import time
+from collections import OrderedDict
+
+from django.db.models import Prefetch
+from reviews.models import Genre, Title
+from rest_framework.renderers import JSONRenderer
+
+from api import renderers
+from api.serializers import TitleReadSerializer
+from benchmarks.database import benchmark_database
+from benchmarks.seed import seed
+
+PAGE_SIZES = (10, 100, 1000)
+
+
+def title_page(size):
+    titles = (
+        Title.objects.select_related("category")
+        .prefetch_related(Prefetch("genre", queryset=Genre.objects.all()))
+        .order_by("id")[:size]
+    )
+    return OrderedDict((
+        ("count", size),
+        ("next", None),
+        ("previous", None),
+        ("results", TitleReadSerializer(titles, many=True).data),
+    ))
+
+
+def median_ms(render, data, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render(data)
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def run(options):
+    with benchmark_database():
+        seed(
+            titles=max(options.page_sizes),
+            genres_per_title=options.genres_per_title,
+            reviews=0,
+            comments=0,
+        )
+        pages = {size: title_page(size) for size in options.page_sizes}
+    stdlib = JSONRenderer()
+    fast = renderers.FastJSONRenderer()
+    report = {}
+    for size, data in pages.items():
+        assert fast.render(data) == stdlib.render(data)
+        report[size] = {
+            "bytes": len(stdlib.render(data)),
+            "stdlib_ms": median_ms(stdlib.render, data, options.repeat),
+            "fast_ms": median_ms(fast.render, data, options.repeat),
+        }
+    return {
+        "encoder": "orjson" if renderers.orjson else "json",
+        "pages": report,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Время рендеринга страницы произведений в JSON"
+    )
+    parser.add_argument(
+        "--page-sizes", type=int, nargs="+", default=PAGE_SIZES
+    )
+    parser.add_argument("--genres-per-title", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--json", action="store_true")
+    options = parser.parse_args()
+    report = run(options)
+    if options.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+    print(f"FastJSONRenderer: {report['encoder']}")
+    for size, result in report["pages"].items():
+        print(
+            f"{size} произведений ({result['bytes']} байт): "
+            f"JSONRenderer {result['stdlib_ms']} ms, "
+            f"FastJSONRenderer {result['fast_ms']} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import json
+import time
+
+from django.test import Client, override_settings
+from reviews.models import User
+
+from api.mail import send_confirmation_mails
+from api.utils import confirmation_message
+from benchmarks.database import benchmark_database
+from tests.fake_smtp import FakeSMTPBackend
+
+FAKE_SMTP = "tests.fake_smtp.FakeSMTPBackend"
+
+
+def signup_latency(queue, count):
+    client = Client()
+    started = time.perf_counter()
+    with override_settings(CONFIRMATION_MAIL_QUEUE=queue):
+        for idx in range(count):
+            client.post("/api/v1/auth/signup/", {
+                "username": f"{'queued' if queue else 'eager'}{idx}",
+                "email": f"{'queued' if queue else 'eager'}{idx}@yamdb.fake",
+            })
+    return (time.perf_counter() - started) / count * 1000
+
+
+def send_one_by_one(users):
+    started = time.perf_counter()
+    for user in users:
+        confirmation_message(user).send()
+    return len(users) / (time.perf_counter() - started)
+
+
+def drain_outbox(batch_size):
+    started = time.perf_counter()
+    sent = 0
+    while True:
+        batch_sent, _ = send_confirmation_mails(batch_size)
+        sent += batch_sent
+        if not batch_sent:
+            break
+    return sent / (time.perf_counter() - started)
+
+
+def run(options):
+    FakeSMTPBackend.reset(
+        connect_delay=options.connect_ms / 1000,
+        send_delay=options.send_ms / 1000,
+    )
+    with benchmark_database(), override_settings(EMAIL_BACKEND=FAKE_SMTP):
+        report = {
+            "connect_ms": options.connect_ms,
+            "send_ms": options.send_ms,
+            "signup_ms": {
+                "synchronous": round(
+                    signup_latency(False, options.signups), 2
+                ),
+                "queued": round(signup_latency(True, options.signups), 2),
+            },
+        }
+        users = list(User.objects.filter(username__startswith="eager"))
+        report["messages_per_second"] = {
+            "connection_per_message": round(send_one_by_one(users), 1),
+            "outbox_batches": round(drain_outbox(options.batch_size), 1),
+        }
+        report["smtp_connections"] = FakeSMTPBackend.connections
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Отправка писем синхронно и через очередь"
+    )
+    parser.add_argument("--signups", type=int, default=300)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--connect-ms", type=float, default=20)
+    parser.add_argument("--send-ms", type=float, default=2)
+    options = parser.parse_args()
+    print(json.dumps(run(options), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import statistics
+import time
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Q
+from reviews.models import Comment, Genre, Review, Title
+
+from benchmarks.database import analyze, benchmark_database
+from benchmarks.seed import seed
+
+# Последняя миграция без составных индексов и уникальности GenreTitle.
+BASELINE_MIGRATION = ("reviews", "0003_title_rating")
+PAGE = 11
+
+
+def build_queries():
+    title_id = Title.objects.order_by("id").values_list("id", flat=True)[0]
+    deep_review = (
+        Review.objects.filter(title_id=title_id)
+        .order_by("-pub_date", "-id")
+        .values("pub_date", "id", "author_id")[PAGE]
+    )
+    review_id = Comment.objects.values_list("review_id", flat=True)[0]
+    genre_slug = Genre.objects.values_list("slug", flat=True)[0]
+    return {
+        "reviews_first_page": lambda: (
+            Review.objects.filter(title_id=title_id)
+            .order_by("pub_date", "id")[:PAGE]
+        ),
+        "reviews_keyset_deep_page": lambda: (
+            Review.objects.filter(title_id=title_id)
+            .filter(
+                Q(pub_date__gt=deep_review["pub_date"])
+                | Q(pub_date=deep_review["pub_date"],
+                    id__gt=deep_review["id"])
+            )
+            .order_by("pub_date", "id")[:PAGE]
+        ),
+        "review_exists_for_author": lambda: Review.objects.filter(
+            title_id=title_id, author_id=deep_review["author_id"]
+        )[:1],
+        "comments_first_page": lambda: (
+            Comment.objects.filter(review_id=review_id)
+            .order_by("pub_date", "id")[:PAGE]
+        ),
+        "titles_by_genre": lambda: (
+            Title.objects.filter(genre__slug=genre_slug).order_by("id")[:PAGE]
+        ),
+    }
+
+
+def measure(queries, repeat):
+    report = {}
+    for name, build in queries.items():
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(build())
+            timings.append((time.perf_counter() - started) * 1000)
+        report[name] = {
+            "plan": build().explain(),
+            "median_ms": round(statistics.median(timings), 3),
+        }
+    return report
+
+
+def migrate_to_baseline():
+    call_command("migrate", *BASELINE_MIGRATION, verbosity=0)
+    analyze()
+
+
+def run(options):
+    with benchmark_database():
+        dataset = seed(
+            titles=options.titles,
+            reviews=options.reviews,
+            comments=options.comments,
+        )
+        analyze()
+        queries = build_queries()
+        after = measure(queries, options.repeat)
+        migrate_to_baseline()
+        before = measure(queries, options.repeat)
+    return {
+        "vendor": connection.vendor,
+        "dataset": dataset,
+        "queries": {
+            name: {"before": before[name], "after": after[name]}
+            for name in queries
+        },
+    }
+
+
+def print_report(report):
+    print(f"{report['vendor']}: {report['dataset']}")
+    for name, result in report["queries"].items():
+        print(f"\n{name}")
+        for stage in ("before", "after"):
+            print(f"  {stage}: {result[stage]['median_ms']} ms")
+            for line in result[stage]["plan"].splitlines():
+                print(f"    {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Планы запросов до и после составных индексов"
+    )
+    parser.add_argument("--titles", type=int, default=1000)
+    parser.add_argument("--reviews", type=int, default=1_000_000)
+    parser.add_argument("--comments", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--json", action="store_true")
+    options = parser.parse_args()
+    report = run(options)
+    if options.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import csv
+import math
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+from reviews.bulk import batches, keep_auto_now_add, reset_sequences
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title, User)
+from reviews.ratings import rebuild_ratings
+
+BATCH_SIZE = 5000
+DATA_DIR = settings.BASE_DIR / "static" / "data"
+DATA_FILES = {
+    "users": "users.csv",
+    "categories": "category.csv",
+    "genres": "genre.csv",
+    "titles": "titles.csv",
+    "genre_links": "genre_title.csv",
+    "reviews": "review.csv",
+    "comments": "comments.csv",
+}
+
+
+def bulk_insert(model, objects, batch_size=BATCH_SIZE):
+    with transaction.atomic(), keep_auto_now_add(model):
+        for batch in batches(objects, batch_size):
+            model.objects.bulk_create(batch)
+
+
+def seed(users=100, categories=3, genres=15, titles=1000,
+         genres_per_title=2, reviews=10000, comments=10000):
+    users = max(users, math.ceil(reviews / titles))
+    genres_per_title = min(genres_per_title, genres)
+    started = timezone.now() - timedelta(seconds=reviews + comments)
+    password = make_password(None)
+
+    bulk_insert(User, (
+        User(
+            id=idx,
+            username=f"user{idx}",
+            email=f"user{idx}@yamdb.fake",
+            password=password,
+        )
+        for idx in range(1, users + 1)
+    ))
+    bulk_insert(Category, (
+        Category(id=idx, name=f"Категория {idx}", slug=f"category-{idx}")
+        for idx in range(1, categories + 1)
+    ))
+    bulk_insert(Genre, (
+        Genre(id=idx, name=f"Жанр {idx}", slug=f"genre-{idx}")
+        for idx in range(1, genres + 1)
+    ))
+    bulk_insert(Title, (
+        Title(
+            id=idx,
+            name=f"Произведение {idx}",
+            year=1900 + idx % 120,
+            description="",
+            category_id=idx % categories + 1,
+        )
+        for idx in range(1, titles + 1)
+    ))
+    bulk_insert(GenreTitle, (
+        GenreTitle(title_id=title_id, genre_id=(title_id + shift) % genres + 1)
+        for title_id in range(1, titles + 1)
+        for shift in range(genres_per_title)
+    ))
+    bulk_insert(Review, (
+        Review(
+            id=idx + 1,
+            title_id=idx % titles + 1,
+            author_id=idx // titles + 1,
+            text=f"Отзыв {idx + 1}",
+            score=idx % 11,
+            pub_date=started + timedelta(seconds=idx),
+        )
+        for idx in range(reviews)
+    ))
+    bulk_insert(Comment, (
+        Comment(
+            id=idx + 1,
+            review_id=idx % reviews + 1,
+            author_id=idx % users + 1,
+            text=f"Комментарий {idx + 1}",
+            pub_date=started + timedelta(seconds=reviews + idx),
+        )
+        for idx in range(comments if reviews else 0)
+    ))
+    reset_sequences([User, Category, Genre, Title, GenreTitle, Review,
+                     Comment])
+    with transaction.atomic():
+        rebuild_ratings()
+    return {
+        "users": users,
+        "categories": categories,
+        "genres": genres,
+        "titles": titles,
+        "genre_links": titles * genres_per_title,
+        "reviews": reviews,
+        "comments": comments if reviews else 0,
+    }
+
+
+def data_shape(path=DATA_DIR):
+    shape = {}
+    for table, filename in DATA_FILES.items():
+        with open(path / filename, encoding="utf-8", newline="") as csv_file:
+            shape[table] = sum(1 for _ in csv.DictReader(csv_file))
+    return shape
+
+
+def scaled_dataset(scale, path=DATA_DIR):
+    shape = data_shape(path)
+    dataset = {
+        table: count * scale
+        for table, count in shape.items() if table != "genre_links"
+    }
+    dataset["genres_per_title"] = max(
+        round(shape["genre_links"] / shape["titles"]), 1
+    )
+    return dataset
@@ -0,0 +1,104 @@
+import argparse
+import json
+import statistics
+import time
+
+from django.db import connection
+from reviews import search
+from reviews.models import Title
+
+from benchmarks.database import analyze, benchmark_database
+from benchmarks.seed import seed
+
+PAGE = 10
+TERMS = ("4242", "999999", "изведение 77", "Произведение")
+
+
+def page_and_count(queryset):
+    return queryset.count(), list(queryset[:PAGE])
+
+
+def build_queries(terms):
+    titles = Title.objects.order_by("id")
+    queries = {}
+    for term in terms:
+        queries[f"name={term}"] = {
+            "before": lambda term=term: titles.filter(name__icontains=term),
+            "after": lambda term=term: search.filter_by_name(titles, term),
+        }
+        queries[f"search={term}"] = {
+            "after": lambda term=term: search.search(titles, term),
+        }
+    return queries
+
+
+def measure(build, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count, _ = page_and_count(build())
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "rows": count,
+        "median_ms": round(statistics.median(timings), 3),
+    }
+
+
+def run(options):
+    with benchmark_database():
+        started = time.perf_counter()
+        dataset = seed(
+            titles=options.titles,
+            genres_per_title=0,
+            reviews=0,
+            comments=0,
+        )
+        seconds = round(time.perf_counter() - started, 1)
+        analyze()
+        queries = build_queries(options.terms)
+        report = {
+            name: {
+                stage: measure(build, options.repeat)
+                for stage, build in stages.items()
+            }
+            for name, stages in queries.items()
+        }
+    return {
+        "vendor": connection.vendor,
+        "dataset": dataset,
+        "seed_seconds": seconds,
+        "queries": report,
+    }
+
+
+def print_report(report):
+    print(
+        f"{report['vendor']}: {report['dataset']['titles']} произведений "
+        f"загружено за {report['seed_seconds']} с"
+    )
+    for name, stages in report["queries"].items():
+        result = ", ".join(
+            f"{stage} {value['median_ms']} ms ({value['rows']} строк)"
+            for stage, value in stages.items()
+        )
+        print(f"{name}: {result}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Поиск произведений: LIKE против полнотекстового индекса"
+    )
+    parser.add_argument("--titles", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--terms", nargs="+", default=TERMS)
+    parser.add_argument("--json", action="store_true")
+    options = parser.parse_args()
+    report = run(options)
+    if options.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import os
 import sys
 
+import pytest
+from django.core.cache import caches
 from django.utils.version import get_version
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -32,4 +34,30 @@ assert get_version() < '4.0.0', 'Пожалуйста, используйте в
 
 pytest_plugins = [
     'tests.fixtures.fixture_user',
+    'tests.fixtures.fixture_query_budget',
+    'tests.fixtures.fixture_cache',
 ]
+
+
+@pytest.fixture(scope='session')
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix,
+                                 tmp_path_factory):
+    # Файловая база вместо общей in-memory: параллельные запросы из потоков
+    # ждут блокировку, а не падают с `database table is locked`.
+    from django.conf import settings
+    for alias, database in settings.DATABASES.items():
+        if database['ENGINE'].endswith('sqlite3'):
+            database.setdefault('TEST', {})['NAME'] = str(
+                tmp_path_factory.mktemp('db') / f'{alias}.sqlite3'
+            )
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def eager_confirmation_mail(settings):
+    settings.CONFIRMATION_MAIL_QUEUE = False
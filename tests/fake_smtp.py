@@ -0,0 +1,54 @@
+import time
+from smtplib import SMTPServerDisconnected
+
+from django.core.mail.backends.base import BaseEmailBackend
+
+
+class FakeSMTPBackend(BaseEmailBackend):
+    outbox = []
+    connections = 0
+    connect_delay = 0
+    send_delay = 0
+    fail_next = 0
+
+    def __init__(self, fail_silently=False, **kwargs):
+        super().__init__(fail_silently=fail_silently, **kwargs)
+        self.connection = None
+
+    @classmethod
+    def reset(cls, connect_delay=0, send_delay=0, fail_next=0):
+        cls.outbox = []
+        cls.connections = 0
+        cls.connect_delay = connect_delay
+        cls.send_delay = send_delay
+        cls.fail_next = fail_next
+
+    def open(self):
+        if self.connection:
+            return False
+        time.sleep(self.connect_delay)
+        FakeSMTPBackend.connections += 1
+        self.connection = True
+        return True
+
+    def close(self):
+        self.connection = None
+
+    def send_messages(self, email_messages):
+        new_connection = self.open()
+        sent = 0
+        try:
+            for message in email_messages:
+                time.sleep(self.send_delay)
+                if FakeSMTPBackend.fail_next:
+                    FakeSMTPBackend.fail_next -= 1
+                    if not self.fail_silently:
+                        raise SMTPServerDisconnected("Fake SMTP failure")
+                    continue
+                message.message()
+                FakeSMTPBackend.outbox.append(message)
+                sent += 1
+        finally:
+            if new_connection:
+                self.close()
+        return sent
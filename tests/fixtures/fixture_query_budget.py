@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+from api.pagination import PubDateKeysetPagination
+from django.urls import resolve
+from rest_framework.pagination import PageNumberPagination
+
+from tests.utils import count_queries
+
+BUDGET_PATH = Path(__file__).resolve().parent.parent / 'query_budget.json'
+PAGE_SIZES = (1, 5, 10)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--update-query-budget', action='store_true',
+        help='Перезаписать query_budget.json наблюдаемым числом запросов.'
+    )
+
+
+def pytest_configure(config):
+    config.observed_queries = {}
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not config.getoption('--update-query-budget'):
+        return
+    budget = json.loads(BUDGET_PATH.read_text(encoding='utf-8'))
+    budget.update(config.observed_queries)
+    BUDGET_PATH.write_text(
+        json.dumps(dict(sorted(budget.items())), indent=2) + '\n',
+        encoding='utf-8',
+    )
+
+
+class QueryBudget:
+
+    def __init__(self, budget, observed, update, monkeypatch):
+        self.budget = budget
+        self.observed = observed
+        self.update = update
+        self.monkeypatch = monkeypatch
+
+    def endpoint(self, method, url):
+        return f'{method.upper()} {resolve(urlparse(url).path).view_name}'
+
+    def request(self, client, method, url, **kwargs):
+        endpoint = self.endpoint(method, url)
+        response, queries = count_queries(client, method, url, **kwargs)
+        assert response.status_code < 400, (
+            f'{method.upper()}-запрос к `{url}` вернул '
+            f'{response.status_code}: {response.content!r}'
+        )
+        self.observed[endpoint] = max(self.observed.get(endpoint, 0), queries)
+        if not self.update:
+            assert endpoint in self.budget, (
+                f'Добавьте `{endpoint}` в {BUDGET_PATH.name} или запустите '
+                'тесты с `--update-query-budget`.'
+            )
+            assert queries <= self.budget[endpoint], (
+                f'{method.upper()}-запрос к `{url}` выполнил {queries} '
+                f'SQL-запросов при бюджете {self.budget[endpoint]} '
+                f'для `{endpoint}`.'
+            )
+        return response, queries
+
+    def set_page_size(self, page_size):
+        self.monkeypatch.setattr(PageNumberPagination, 'page_size', page_size)
+        self.monkeypatch.setattr(
+            PubDateKeysetPagination, 'page_size', page_size
+        )
+
+    def request_pages(self, client, url, page_sizes=PAGE_SIZES):
+        counts = []
+        for page_size in page_sizes:
+            self.set_page_size(page_size)
+            response, queries = self.request(client, 'get', url)
+            assert len(response.json()['results']) == page_size, (
+                f'Для проверки `{url}` нужно не меньше {page_size} объектов.'
+            )
+            counts.append(queries)
+        assert len(set(counts)) == 1, (
+            f'Проверьте, что число SQL-запросов GET-запроса к `{url}` не '
+            f'зависит от размера страницы {page_sizes}: {counts}.'
+        )
+        return counts[0]
+
+
+@pytest.fixture(scope='session')
+def query_budget_file():
+    return json.loads(BUDGET_PATH.read_text(encoding='utf-8'))
+
+
+@pytest.fixture
+def query_budget(request, query_budget_file, monkeypatch):
+    return QueryBudget(
+        query_budget_file,
+        request.config.observed_queries,
+        request.config.getoption('--update-query-budget'),
+        monkeypatch,
+    )
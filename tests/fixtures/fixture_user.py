@@ -1,4 +1,7 @@
+from http import HTTPStatus
+
 import pytest
+from django.contrib.auth.tokens import default_token_generator
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import AccessToken
 
@@ -109,3 +112,19 @@ def user_client(token_user):
     client = APIClient()
     client.credentials(HTTP_AUTHORIZATION=f'Bearer {token_user["access"]}')
     return client
+
+
+@pytest.fixture
+def create_claims_client(client):
+    def create(user):
+        response = client.post('/api/v1/auth/token/', data={
+            'username': user.username,
+            'confirmation_code': default_token_generator.make_token(user),
+        })
+        assert response.status_code == HTTPStatus.OK
+        claims_client = APIClient()
+        claims_client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {response.json()["token"]}'
+        )
+        return claims_client
+    return create
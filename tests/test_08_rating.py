@@ -0,0 +1,149 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Review, Title, User
+
+from tests.utils import create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08Rating:
+
+    def get_rating(self, client, title_id):
+        response = client.get(f'/api/v1/titles/{title_id}/')
+        assert response.status_code == HTTPStatus.OK
+        return response.json().get('rating')
+
+    def test_01_rating_follows_reviews(self, client, admin_client, admin,
+                                       user_client, user, moderator_client,
+                                       moderator):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        reviews, titles = create_reviews(admin_client, author_map)
+        title_id = titles[0]['id']
+        assert self.get_rating(client, title_id) == 5, (
+            'Проверьте, что после создания отзывов рейтинг произведения '
+            'равен средней оценке.'
+        )
+
+        response = user_client.patch(
+            f'/api/v1/titles/{title_id}/reviews/{reviews[1]["id"]}/',
+            data={'score': 10}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_rating(client, title_id) == 6, (
+            'Проверьте, что после изменения оценки отзыва рейтинг '
+            'произведения пересчитывается.'
+        )
+
+        response = admin_client.delete(
+            f'/api/v1/titles/{title_id}/reviews/{reviews[0]["id"]}/'
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_rating(client, title_id) == 7, (
+            'Проверьте, что после удаления отзыва рейтинг произведения '
+            'пересчитывается.'
+        )
+
+        user.delete()
+        assert self.get_rating(client, title_id) == 5, (
+            'Проверьте, что при удалении автора его отзывы перестают '
+            'учитываться в рейтинге произведения.'
+        )
+
+        moderator.delete()
+        assert self.get_rating(client, title_id) is None, (
+            'Проверьте, что рейтинг произведения без отзывов равен `None`.'
+        )
+
+    def test_02_rebuild_ratings_command(self, client, admin_client, admin,
+                                        user_client, user):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        for author_client, score in ((admin_client, 3), (user_client, 8)):
+            response = author_client.post(
+                f'/api/v1/titles/{title_id}/reviews/',
+                data={'text': 'review', 'score': score}
+            )
+            assert response.status_code == HTTPStatus.CREATED
+        Title.objects.update(rating_sum=0, rating_count=0)
+
+        call_command('rebuild_ratings', stdout=StringIO())
+
+        title = Title.objects.get(pk=title_id)
+        assert (title.rating_sum, title.rating_count) == (11, 2), (
+            'Проверьте, что команда `rebuild_ratings` пересчитывает '
+            'сумму и количество оценок произведения.'
+        )
+        assert self.get_rating(client, title_id) == 5
+        assert self.get_rating(client, titles[1]['id']) is None
+
+    def test_03_stale_score(self, admin, user):
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=user, text='review', score=5
+        )
+        first = Review.objects.get(pk=review.pk)
+        second = Review.objects.get(pk=review.pk)
+        first.score = 8
+        first.save()
+        second.score = 2
+        second.save()
+
+        title.refresh_from_db()
+        assert (title.rating_sum, title.rating_count) == (2, 1), (
+            'Проверьте, что изменение оценки считает разницу от значения '
+            'в базе, а не от загруженного вместе с объектом.'
+        )
+
+    def count_title_delete(self, admin_client, reviews):
+        title = Title.objects.create(name='Произведение', year=2000)
+        authors = User.objects.bulk_create(
+            User(username=f'author{idx}', email=f'author{idx}@yamdb.fake')
+            for idx in range(reviews)
+        )
+        for author in User.objects.filter(
+                username__in=[author.username for author in authors]
+        ):
+            Review.objects.create(
+                title=title, author=author, text='review', score=5
+            )
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.delete(f'/api/v1/titles/{title.id}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        User.objects.filter(username__startswith='author').delete()
+        return len(context.captured_queries)
+
+    def test_04_cascade_delete_queries(self, admin_client, user):
+        assert self.count_title_delete(admin_client, 1) == (
+            self.count_title_delete(admin_client, 10)
+        ), (
+            'Проверьте, что при удалении произведения рейтинг не '
+            'обновляется отдельным запросом на каждый отзыв.'
+        )
+
+        titles = [
+            Title.objects.create(name=f'Произведение {idx}', year=2000)
+            for idx in range(2)
+        ]
+        for title in titles:
+            Review.objects.create(
+                title=title, author=user, text='review', score=5
+            )
+        with CaptureQueriesContext(connection) as context:
+            user.delete()
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "reviews_title"')
+        ]
+        assert len(updates) == len(titles)
+        assert set(
+            Title.objects.values_list('rating_sum', 'rating_count')
+        ) == {(0, 0)}
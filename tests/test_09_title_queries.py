@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+from reviews.models import Category, Genre, GenreTitle, Title
+
+
+def create_catalog(titles_count, genres_per_title):
+    category = Category.objects.create(name='Фильм', slug='movie')
+    Genre.objects.bulk_create(
+        Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+        for idx in range(genres_per_title)
+    )
+    genres = list(Genre.objects.all())
+    Title.objects.bulk_create(
+        Title(name=f'Произведение {idx}', year=2000, category=category)
+        for idx in range(titles_count)
+    )
+    titles = list(Title.objects.order_by('id'))
+    GenreTitle.objects.bulk_create(
+        GenreTitle(title=title, genre=genre)
+        for title in titles for genre in genres
+    )
+    return titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09TitleQueries:
+    url = '/api/v1/titles/'
+
+    @pytest.mark.parametrize('titles_count', (3, 15))
+    def test_01_titles_list_queries(self, client, django_assert_num_queries,
+                                    titles_count):
+        create_catalog(titles_count, genres_per_title=10)
+
+        with django_assert_num_queries(3):
+            response = client.get(self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert len(results) == min(titles_count, 10)
+        assert all(len(title['genre']) == 10 for title in results), (
+            f'Проверьте, что GET-запрос к `{self.url}` возвращает все жанры '
+            'произведения.'
+        )
+        assert all(title['category']['slug'] == 'movie' for title in results)
+
+    def test_02_title_detail_queries(self, client, django_assert_num_queries):
+        titles = create_catalog(1, genres_per_title=10)
+
+        with django_assert_num_queries(2):
+            response = client.get(f'{self.url}{titles[0].id}/')
+
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert len(data['genre']) == 10
+        assert data['category'] == {'name': 'Фильм', 'slug': 'movie'}
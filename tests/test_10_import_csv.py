@@ -0,0 +1,60 @@
+import csv
+import os
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title, User)
+
+from tests.conftest import MANAGE_PATH
+
+DATA_PATH = os.path.join(MANAGE_PATH, 'static', 'data')
+
+
+def count_rows(filename):
+    with open(os.path.join(DATA_PATH, filename), encoding='utf-8',
+              newline='') as csv_file:
+        return sum(1 for _ in csv.DictReader(csv_file))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10ImportCSV:
+
+    def test_01_import_csv(self):
+        out = StringIO()
+        call_command('import_csv', batch_size=10, stdout=out)
+
+        expected = (
+            ('users.csv', User),
+            ('category.csv', Category),
+            ('genre.csv', Genre),
+            ('titles.csv', Title),
+            ('genre_title.csv', GenreTitle),
+            ('review.csv', Review),
+            ('comments.csv', Comment),
+        )
+        for filename, model in expected:
+            assert model.objects.count() == count_rows(filename), (
+                f'Проверьте, что команда `import_csv` загружает все строки '
+                f'из файла `{filename}`.'
+            )
+        assert 'строк/с' in out.getvalue(), (
+            'Проверьте, что команда `import_csv` выводит скорость загрузки '
+            'для каждой таблицы.'
+        )
+
+        review = Review.objects.get(pk=1)
+        assert (review.title_id, review.author_id, review.score) == (
+            1, 100, 10
+        )
+        assert review.pub_date.isoformat() == '2019-09-24T21:08:21.567000+00:00', (
+            'Проверьте, что команда `import_csv` сохраняет `pub_date` '
+            'из csv файла.'
+        )
+        title = Title.objects.get(pk=1)
+        assert title.rating_count == title.reviews.count(), (
+            'Проверьте, что после загрузки отзывов пересчитывается рейтинг '
+            'произведений.'
+        )
+        assert not User.objects.get(pk=100).has_usable_password()
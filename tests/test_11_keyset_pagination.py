@@ -0,0 +1,90 @@
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+from reviews.models import Comment, Review, Title, User
+
+
+def walk(client, url, link_key='next'):
+    ids = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert 'count' not in data, (
+            'Проверьте, что в режиме `pagination=cursor` ответ не содержит '
+            'ключ `count`.'
+        )
+        ids.extend(item['id'] for item in data['results'])
+        url = data[link_key]
+    return ids, data
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11KeysetPagination:
+
+    @pytest.fixture
+    def review_with_comments(self, user):
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=user, text='review', score=5
+        )
+        Comment.objects.bulk_create(
+            Comment(review=review, author=user, text=f'comment {idx}')
+            for idx in range(25)
+        )
+        # Одинаковая дата у всех комментариев, как после импорта из csv.
+        Comment.objects.update(pub_date=timezone.now())
+        return title, review
+
+    def test_01_comments_cursor_walk(self, client, review_with_comments):
+        title, review = review_with_comments
+        url = (f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+               '?pagination=cursor')
+
+        ids, last_page = walk(client, url)
+
+        expected = list(
+            Comment.objects.order_by('pub_date', 'id')
+            .values_list('id', flat=True)
+        )
+        assert ids == expected, (
+            'Проверьте, что постраничный обход комментариев в режиме '
+            '`pagination=cursor` возвращает каждый комментарий ровно один '
+            'раз в порядке (`pub_date`, `id`).'
+        )
+        previous_ids, _ = walk(client, last_page['previous'], 'previous')
+        assert len(previous_ids) == 20
+        assert set(previous_ids) == set(expected[:20])
+
+    def test_02_reviews_cursor_walk(self, client):
+        title = Title.objects.create(name='Произведение', year=2000)
+        for idx in range(12):
+            author = User.objects.create(
+                username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+            )
+            Review.objects.create(
+                title=title, author=author, text='review', score=idx % 10
+            )
+        url = f'/api/v1/titles/{title.id}/reviews/?pagination=cursor'
+
+        ids, _ = walk(client, url)
+
+        assert ids == list(
+            title.reviews.order_by('pub_date', 'id')
+            .values_list('id', flat=True)
+        )
+
+        response = client.get(f'/api/v1/titles/{title.id}/reviews/')
+        assert response.json()['count'] == 12, (
+            'Проверьте, что без параметра `pagination=cursor` используется '
+            'постраничная пагинация с ключом `count`.'
+        )
+
+    def test_03_invalid_cursor(self, client, review_with_comments):
+        title, review = review_with_comments
+        response = client.get(
+            f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+            '?cursor=broken'
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+import pytest
+from api.cache import get_version
+from django.db import transaction
+from reviews.models import Category
+
+from tests.utils import create_categories, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('shared_cache')
+class Test12ResponseCache:
+
+    def test_01_anonymous_list_is_cached(self, client, admin_client,
+                                         django_assert_num_queries):
+        create_categories(admin_client)
+        url = '/api/v1/categories/'
+        first = client.get(url)
+        assert first.status_code == HTTPStatus.OK
+
+        with django_assert_num_queries(0):
+            second = client.get(url)
+        assert second.json() == first.json(), (
+            f'Проверьте, что повторный GET-запрос неавторизованного '
+            f'пользователя к `{url}` отдаётся из кэша.'
+        )
+
+        admin_client.post(url, data={'name': 'Музыка', 'slug': 'music'})
+        slugs = {item['slug'] for item in client.get(url).json()['results']}
+        assert 'music' in slugs, (
+            'Проверьте, что кэш списка категорий сбрасывается после '
+            'создания новой категории.'
+        )
+
+    def test_02_normalized_query_params(self, client, admin_client,
+                                        django_assert_num_queries):
+        titles, categories, genres = create_titles(admin_client)
+        url = '/api/v1/titles/'
+        response = client.get(
+            f'{url}?genre={genres[0]["slug"]}&year={titles[0]["year"]}'
+        )
+        assert response.json()['count'] == 1
+
+        with django_assert_num_queries(0):
+            response = client.get(
+                f'{url}?year={titles[0]["year"]}&name=&'
+                f'genre={genres[0]["slug"]}'
+            )
+        assert response.json()['count'] == 1
+
+        with django_assert_num_queries(3):
+            response = client.get(f'{url}?genre={genres[2]["slug"]}')
+        assert response.json()['count'] == 1
+
+    def test_03_title_cache_invalidation(self, client, admin_client,
+                                         user_client):
+        titles, categories, genres = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        assert client.get(url).json()['rating'] is None
+
+        user_client.post(f'{url}reviews/', data={'text': 'x', 'score': 8})
+        assert client.get(url).json()['rating'] == 8, (
+            'Проверьте, что кэш произведения сбрасывается при изменении '
+            'его рейтинга.'
+        )
+
+        admin_client.patch(url, data={'genre': [genres[2]['slug']]})
+        assert client.get(url).json()['genre'] == [genres[2]], (
+            'Проверьте, что кэш произведения сбрасывается при изменении '
+            'его жанров.'
+        )
+
+        admin_client.delete(f'/api/v1/genres/{genres[2]["slug"]}/')
+        assert client.get(url).json()['genre'] == []
+
+        admin_client.delete(f'/api/v1/categories/{categories[0]["slug"]}/')
+        assert client.get(url).json()['category'] is None, (
+            'Проверьте, что кэш произведения сбрасывается при удалении '
+            'его категории.'
+        )
+
+        admin_client.delete(url)
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+    def test_04_authenticated_requests_bypass_cache(
+            self, admin_client, django_assert_num_queries):
+        create_categories(admin_client)
+        admin_client.get('/api/v1/categories/')
+        with django_assert_num_queries(3):
+            admin_client.get('/api/v1/categories/')
+
+    def test_05_invalidation_waits_for_commit(self):
+        version = get_version('categories')
+        with transaction.atomic():
+            Category.objects.create(name='Фильм', slug='films')
+            assert get_version('categories') == version, (
+                'Проверьте, что версия кэша меняется только после '
+                'фиксации транзакции.'
+            )
+        assert get_version('categories') != version
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_cache_disables_response_cache(client, admin_client):
+    create_categories(admin_client)
+    url = '/api/v1/categories/'
+    client.get(url)
+    # bulk_create не шлёт сигналов: так выглядит запись другого процесса.
+    Category.objects.bulk_create([Category(name='Музыка', slug='music')])
+    slugs = {item['slug'] for item in client.get(url).json()['results']}
+    assert 'music' in slugs, (
+        'Проверьте, что с кэшем LocMemCache, который не видит записей '
+        'других процессов, ответы API не кэшируются.'
+    )
@@ -0,0 +1,141 @@
+from http import HTTPStatus
+
+import pytest
+from django.utils.http import parse_http_date
+
+from tests.utils import create_comments, create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures('shared_cache')
+class Test13ConditionalGet:
+
+    def check_not_modified(self, client, url, django_assert_num_queries):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        etag = response.get('ETag')
+        assert etag and response.get('Last-Modified'), (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'заголовки `ETag` и `Last-Modified`.'
+        )
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с актуальным '
+            '`If-None-Match` возвращает ответ со статусом 304 без '
+            'обращения к базе данных.'
+        )
+        assert response.get('ETag') == etag
+        return etag
+
+    def test_01_titles(self, client, admin_client,
+                       django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        etag = self.check_not_modified(
+            client, url, django_assert_num_queries
+        )
+        last_modified = client.get(url)['Last-Modified']
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        admin_client.patch(url, data={'name': 'Новое название'})
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что после изменения произведения его `ETag` '
+            'меняется.'
+        )
+        assert response.json()['name'] == 'Новое название'
+
+        self.check_not_modified(
+            client, '/api/v1/titles/?year=1984', django_assert_num_queries
+        )
+
+    def test_02_reviews(self, client, admin_client, admin, user_client,
+                        user, django_assert_num_queries):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client}
+        )
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        etag = self.check_not_modified(
+            client, url, django_assert_num_queries
+        )
+        other_title_url = f'/api/v1/titles/{titles[1]["id"]}/reviews/'
+        other_etag = client.get(other_title_url)['ETag']
+
+        user_client.post(url, data={'text': 'Новый отзыв', 'score': 3})
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что после добавления отзыва `ETag` списка отзывов '
+            'меняется.'
+        )
+        assert response.json()['count'] == 2
+        response = client.get(other_title_url, HTTP_IF_NONE_MATCH=other_etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            'Проверьте, что `ETag` отзывов не меняется при добавлении '
+            'отзыва к другому произведению.'
+        )
+
+        etag = client.get(url)['ETag']
+        admin.username = 'RenamedAdmin'
+        admin.save()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+
+    def test_03_comments(self, client, admin_client, admin,
+                         django_assert_num_queries):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client}
+        )
+        url = (f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+               f'{reviews[0]["id"]}/comments/')
+        etag = self.check_not_modified(
+            client, f'{url}{comments[0]["id"]}/', django_assert_num_queries
+        )
+        admin_client.delete(f'{url}{comments[0]["id"]}/')
+        response = client.get(
+            f'{url}{comments[0]["id"]}/', HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert 'ETag' not in response
+
+        etag = client.get(url)['ETag']
+        admin_client.delete(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}/'
+        )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что после удаления отзыва список его комментариев '
+            'не отдаётся по старому `ETag`.'
+        )
+
+    def test_04_same_second_write(self, client, admin_client, admin,
+                                  user_client, monkeypatch):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client}
+        )
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        last_modified = client.get(url)['Last-Modified']
+        monkeypatch.setattr(
+            'time.time', lambda: parse_http_date(last_modified) + 0.5
+        )
+
+        user_client.post(url, data={'text': 'Новый отзыв', 'score': 3})
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что запись в ту же секунду меняет `Last-Modified` '
+            'и запрос с `If-Modified-Since` получает новые данные.'
+        )
+        assert response.json()['count'] == 2
+        assert response['Last-Modified'] != last_modified
+
+
+@pytest.mark.django_db(transaction=True)
+def test_local_cache_disables_etags(client, admin_client):
+    titles, _, _ = create_titles(admin_client)
+    response = client.get(f'/api/v1/titles/{titles[0]["id"]}/')
+    assert response.status_code == HTTPStatus.OK
+    assert not response.has_header('ETag'), (
+        'Проверьте, что с кэшем LocMemCache, у которого в каждом процессе '
+        'свои версии, `ETag` не выдаётся.'
+    )
@@ -0,0 +1,178 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+from threading import Barrier
+
+import pytest
+from api import mail as outbox
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection, transaction
+from reviews.models import ConfirmationMail, User
+
+from tests.fake_smtp import FakeSMTPBackend
+
+SIGNUP_URL = '/api/v1/auth/signup/'
+
+
+@pytest.fixture
+def queued_mail(settings):
+    settings.CONFIRMATION_MAIL_QUEUE = True
+    settings.EMAIL_BACKEND = 'tests.fake_smtp.FakeSMTPBackend'
+    FakeSMTPBackend.reset()
+    yield FakeSMTPBackend
+    FakeSMTPBackend.reset()
+
+
+def signup(client, username):
+    response = client.post(SIGNUP_URL, data={
+        'username': username, 'email': f'{username}@yamdb.fake'
+    })
+    assert response.status_code == HTTPStatus.OK
+    return response
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14MailOutbox:
+
+    def test_01_signup_enqueues_mail(self, client, queued_mail):
+        signup(client, 'queued_user')
+
+        assert queued_mail.outbox == [] and mail.outbox == [], (
+            f'Проверьте, что POST-запрос к `{SIGNUP_URL}` не отправляет '
+            'письмо синхронно, а ставит его в очередь.'
+        )
+        assert ConfirmationMail.objects.filter(
+            user__username='queued_user'
+        ).count() == 1
+
+        call_command('send_confirmation_mails', stdout=StringIO())
+
+        assert len(queued_mail.outbox) == 1
+        assert queued_mail.outbox[0].to == ['queued_user@yamdb.fake']
+        assert not ConfirmationMail.objects.exists()
+        code = queued_mail.outbox[0].body.split()[-1]
+        response = client.post('/api/v1/auth/token/', data={
+            'username': 'queued_user', 'confirmation_code': code
+        })
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что код подтверждения из письма, отправленного '
+            'из очереди, позволяет получить токен.'
+        )
+
+    def test_02_batch_uses_single_connection(self, client, queued_mail):
+        for idx in range(5):
+            signup(client, f'user{idx}')
+        signup(client, 'user0')
+
+        call_command(
+            'send_confirmation_mails', batch_size=10, stdout=StringIO()
+        )
+
+        assert queued_mail.connections == 1, (
+            'Проверьте, что письма из одной пачки отправляются через одно '
+            'соединение с почтовым сервером.'
+        )
+        assert len(queued_mail.outbox) == 5, (
+            'Проверьте, что повторные запросы кода одним пользователем '
+            'в пределах пачки приводят к одному письму.'
+        )
+
+    def test_03_failed_mail_is_retried(self, client, queued_mail):
+        signup(client, 'retry_user')
+        queued_mail.fail_next = 1
+
+        call_command('send_confirmation_mails', stdout=StringIO())
+
+        queued = ConfirmationMail.objects.get()
+        assert queued.attempts == 1 and queued.error
+        assert queued_mail.outbox == []
+
+        call_command('send_confirmation_mails', stdout=StringIO())
+        assert queued_mail.outbox == [], (
+            'Проверьте, что повторная отправка откладывается до '
+            '`next_attempt`.'
+        )
+
+        ConfirmationMail.objects.update(
+            next_attempt=queued.next_attempt - timedelta(days=1)
+        )
+        call_command('send_confirmation_mails', stdout=StringIO())
+        assert len(queued_mail.outbox) == 1
+        assert not ConfirmationMail.objects.exists()
+
+    def test_04_mails_of_deleted_users_are_dropped(self, client,
+                                                   queued_mail):
+        signup(client, 'deleted_user')
+        User.objects.get(username='deleted_user').delete()
+
+        call_command('send_confirmation_mails', stdout=StringIO())
+        assert queued_mail.outbox == []
+
+    def test_05_send_outside_transaction(self, client, queued_mail,
+                                         monkeypatch):
+        signup(client, 'lock_user')
+        in_atomic = []
+        send_messages = queued_mail.send_messages
+
+        def spy(backend, messages):
+            in_atomic.append(transaction.get_connection().in_atomic_block)
+            return send_messages(backend, messages)
+
+        monkeypatch.setattr(queued_mail, 'send_messages', spy)
+        call_command('send_confirmation_mails', stdout=StringIO())
+        assert in_atomic == [False], (
+            'Проверьте, что письма отправляются вне транзакции, без '
+            'удержания блокировок строк очереди.'
+        )
+
+    def test_06_unexpected_error_fails_only_its_row(
+            self, client, queued_mail, monkeypatch):
+        for username in ('good_user', 'bad_user'):
+            signup(client, username)
+        message = outbox.confirmation_message
+
+        def broken_message(user, connection=None):
+            if user.username == 'bad_user':
+                raise ValueError('broken template')
+            return message(user, connection)
+
+        monkeypatch.setattr(outbox, 'confirmation_message', broken_message)
+        call_command('send_confirmation_mails', stdout=StringIO())
+
+        assert [sent.to for sent in queued_mail.outbox] == [
+            ['good_user@yamdb.fake']
+        ]
+        failed = ConfirmationMail.objects.get()
+        assert failed.user.username == 'bad_user'
+        assert failed.attempts == 1 and 'broken template' in failed.error, (
+            'Проверьте, что непредвиденная ошибка при отправке одного '
+            'письма учитывается в его попытках и не откатывает пачку.'
+        )
+        assert failed.lease is None
+
+    def test_07_concurrent_workers_send_once(self, client, queued_mail):
+        workers = 4
+        for idx in range(20):
+            signup(client, f'parallel{idx}')
+        queued_mail.send_delay = 0.01
+        barrier = Barrier(workers)
+
+        def work(_):
+            barrier.wait()
+            try:
+                return outbox.send_confirmation_mails(batch_size=5)
+            finally:
+                connection.close()
+
+        while ConfirmationMail.objects.exists():
+            with ThreadPoolExecutor(workers) as executor:
+                list(executor.map(work, range(workers)))
+
+        recipients = [sent.to[0] for sent in queued_mail.outbox]
+        assert sorted(recipients) == sorted(set(recipients)), (
+            'Проверьте, что одновременно работающие отправщики не '
+            'отправляют одно письмо дважды.'
+        )
+        assert len(recipients) == 20
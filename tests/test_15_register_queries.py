@@ -0,0 +1,54 @@
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+
+SIGNUP_URL = '/api/v1/auth/signup/'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15RegisterQueries:
+    data = {'username': 'new_user', 'email': 'new_user@yamdb.fake'}
+
+    @pytest.mark.parametrize('queue,extra_queries', ((False, 0), (True, 1)))
+    def test_01_signup_query_count(self, client, settings,
+                                   django_assert_num_queries,
+                                   queue, extra_queries):
+        settings.CONFIRMATION_MAIL_QUEUE = queue
+
+        with django_assert_num_queries(2 + extra_queries):
+            response = client.post(SIGNUP_URL, data=self.data)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == self.data
+
+        with django_assert_num_queries(1 + extra_queries):
+            response = client.post(SIGNUP_URL, data=self.data)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что повторный POST-запрос к `{SIGNUP_URL}` '
+            'выполняет не больше одного запроса к таблице пользователей.'
+        )
+        assert response.json() == self.data
+        assert len(mail.outbox) == (0 if queue else 2)
+
+    def test_02_conflicts(self, client, django_assert_num_queries,
+                          django_user_model):
+        client.post(SIGNUP_URL, data=self.data)
+
+        with django_assert_num_queries(1):
+            response = client.post(SIGNUP_URL, data={
+                'username': self.data['username'],
+                'email': 'other@yamdb.fake',
+            })
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'username' in response.json(), (
+            f'Проверьте, что при POST-запросе к `{SIGNUP_URL}` с занятым '
+            '`username` ответ содержит ошибку поля `username`.'
+        )
+
+        with django_assert_num_queries(1):
+            response = client.post(SIGNUP_URL, data={
+                'username': 'other_user',
+                'email': self.data['email'],
+            })
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert django_user_model.objects.count() == 1
@@ -0,0 +1,99 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.tokens import default_token_generator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.utils import create_titles
+
+
+def claims_client(client, user):
+    response = client.post('/api/v1/auth/token/', data={
+        'username': user.username,
+        'confirmation_code': default_token_generator.make_token(user),
+    })
+    assert response.status_code == HTTPStatus.OK
+    claims_client = APIClient()
+    claims_client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {response.json()["token"]}'
+    )
+    return claims_client
+
+
+def count_queries(func):
+    with CaptureQueriesContext(connection) as context:
+        response = func()
+    return response, len(context.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16StatelessJWT:
+
+    def test_01_no_user_query(self, client, admin_client, user, user_client):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        stateless_client = claims_client(client, user)
+
+        response = user_client.post(url, data={'text': 'text', 'score': 5})
+        assert response.status_code == HTTPStatus.CREATED
+        review_url = f'{url}{response.json()["id"]}/'
+        response, stateless_queries = count_queries(
+            lambda: stateless_client.patch(review_url, data={'score': 7})
+        )
+        assert response.status_code == HTTPStatus.OK
+        response, patch_queries = count_queries(
+            lambda: user_client.patch(review_url, data={'score': 8})
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert stateless_queries == patch_queries - 1, (
+            'Проверьте, что запрос с токеном, выданным `/api/v1/auth/token/`, '
+            'не загружает пользователя из базы данных.'
+        )
+        assert response.json()['author'] == user.username
+
+    def test_02_role_change(self, client, admin_client, user, moderator,
+                            moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        response = moderator_client.post(url, data={'text': 't', 'score': 5})
+        review_url = f'{url}{response.json()["id"]}/'
+        stateless_client = claims_client(client, user)
+
+        response = stateless_client.delete(review_url)
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+        response = admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'role': 'moderator'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = stateless_client.delete(review_url)
+        assert response.status_code == HTTPStatus.NO_CONTENT, (
+            'Проверьте, что после изменения роли пользователя его старый '
+            'токен получает права новой роли.'
+        )
+
+    def test_03_deleted_user(self, client, user):
+        stateless_client = claims_client(client, user)
+        assert stateless_client.get('/api/v1/users/me/').status_code == (
+            HTTPStatus.OK
+        )
+        user.delete()
+        response = stateless_client.get('/api/v1/users/me/')
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что токен удалённого пользователя отклоняется.'
+        )
+
+    def test_04_me(self, client, user):
+        stateless_client = claims_client(client, user)
+        response = stateless_client.patch(
+            '/api/v1/users/me/', data={'first_name': 'Имя'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data['email'] == user.email
+        assert data['bio'] == user.bio
+        user.refresh_from_db()
+        assert user.first_name == 'Имя'
+        assert user.email == 'testuser@yamdb.fake'
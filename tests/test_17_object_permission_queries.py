@@ -0,0 +1,80 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_titles
+
+USER_TABLE_QUERY = 'FROM "reviews_user"'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17ObjectPermissionQueries:
+
+    def get_urls(self, admin_client, author_client):
+        titles, _, _ = create_titles(admin_client)
+        reviews_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        response = author_client.post(
+            reviews_url, data={'text': 'review', 'score': 5}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        review_url = f'{reviews_url}{response.json()["id"]}/'
+        response = author_client.post(
+            f'{review_url}comments/', data={'text': 'comment'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        comment_url = f'{review_url}comments/{response.json()["id"]}/'
+        return review_url, comment_url
+
+    def check_request(self, method, url, data, expected_status, role):
+        with CaptureQueriesContext(connection) as context:
+            response = method(url, data=data)
+        assert response.status_code == expected_status
+        user_queries = [
+            query['sql'] for query in context.captured_queries
+            if USER_TABLE_QUERY in query['sql']
+        ]
+        assert not user_queries, (
+            f'Проверьте, что {role} изменяет или удаляет `{url}` без '
+            'отдельного запроса к таблице пользователей.'
+        )
+        return len(context.captured_queries)
+
+    @pytest.mark.parametrize('role', ('author', 'moderator', 'admin'))
+    def test_01_mutations_skip_user_query(self, create_claims_client,
+                                          admin_client, user_client, user,
+                                          moderator, admin, role):
+        review_url, comment_url = self.get_urls(admin_client, user_client)
+        actor = {'author': user, 'moderator': moderator, 'admin': admin}
+        actor_client = create_claims_client(actor[role])
+
+        for url, data in (
+                (comment_url, {'text': 'edited'}),
+                (review_url, {'score': 7}),
+        ):
+            self.check_request(
+                actor_client.patch, url, data, HTTPStatus.OK, role
+            )
+        for url in (comment_url, review_url):
+            self.check_request(
+                actor_client.delete, url, None, HTTPStatus.NO_CONTENT, role
+            )
+
+    def test_02_same_cost_for_every_role(self, create_claims_client,
+                                         admin_client, user_client, user,
+                                         moderator, admin):
+        review_url, _ = self.get_urls(admin_client, user_client)
+        costs = {
+            role: self.check_request(
+                create_claims_client(actor).patch,
+                review_url, {'text': role}, HTTPStatus.OK, role
+            )
+            for role, actor in (
+                ('author', user), ('moderator', moderator), ('admin', admin)
+            )
+        }
+        assert len(set(costs.values())) == 1, (
+            'Проверьте, что проверка прав автора, модератора и '
+            f'администратора выполняет одинаковое число запросов: {costs}'
+        )
@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+from api.pagination import OptionalKeysetPagination, PubDateKeysetPagination
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Comment, Review, Title, User
+
+AUTHORS = 30
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18ListingQueries:
+
+    @pytest.fixture
+    def review_urls(self):
+        User.objects.bulk_create(
+            User(username=f'author{idx}', email=f'author{idx}@yamdb.fake')
+            for idx in range(AUTHORS)
+        )
+        authors = list(User.objects.all())
+        title = Title.objects.create(name='Произведение', year=2000)
+        Review.objects.bulk_create(
+            Review(title=title, author=author, text='review', score=5)
+            for author in authors
+        )
+        review = Review.objects.first()
+        Comment.objects.bulk_create(
+            Comment(review=review, author=author, text='comment')
+            for author in authors
+        )
+        reviews_url = f'/api/v1/titles/{title.id}/reviews/'
+        return reviews_url, f'{reviews_url}{review.id}/comments/'
+
+    def count_queries(self, client, url, monkeypatch, page_size):
+        monkeypatch.setattr(OptionalKeysetPagination, 'page_size', page_size)
+        monkeypatch.setattr(PubDateKeysetPagination, 'page_size', page_size)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()['results']) == page_size
+        return len(context.captured_queries)
+
+    @pytest.mark.parametrize('mode', ('', '?pagination=cursor'))
+    def test_01_query_count_ignores_page_size(self, client, review_urls,
+                                              monkeypatch, mode):
+        for url in review_urls:
+            counts = [
+                self.count_queries(client, url + mode, monkeypatch, size)
+                for size in (1, 10, AUTHORS)
+            ]
+            assert len(set(counts)) == 1, (
+                f'Проверьте, что GET-запрос к `{url}{mode}` загружает '
+                'авторов в том же запросе: число запросов не должно '
+                f'зависеть от размера страницы ({counts}).'
+            )
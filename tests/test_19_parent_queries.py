@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Review, Title
+
+
+def parent_queries(method, url, table, **kwargs):
+    with CaptureQueriesContext(connection) as context:
+        response = method(url, **kwargs)
+    return response, sum(
+        f'FROM "{table}"' in query['sql']
+        for query in context.captured_queries
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19ParentQueries:
+
+    @pytest.fixture
+    def title(self):
+        return Title.objects.create(name='Произведение', year=2000)
+
+    def test_01_create_fetches_parent_once(self, user_client, title,
+                                           moderator):
+        url = f'/api/v1/titles/{title.id}/reviews/'
+        response, count = parent_queries(
+            user_client.post, url, 'reviews_title',
+            data={'text': 'review', 'score': 5}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert count == 1, (
+            f'Проверьте, что POST-запрос к `{url}` загружает произведение '
+            'один раз.'
+        )
+
+        review = Review.objects.create(
+            title=title, author=moderator, text='review', score=5
+        )
+        url = f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+        response, count = parent_queries(
+            user_client.post, url, 'reviews_review', data={'text': 'comment'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert count == 1, (
+            f'Проверьте, что POST-запрос к `{url}` загружает отзыв один раз.'
+        )
+
+    def test_02_list_checks_parent_only_when_empty(self, client, title,
+                                                   user):
+        url = f'/api/v1/titles/{title.id}/reviews/'
+        response, count = parent_queries(client.get, url, 'reviews_title')
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['results'] == []
+        assert count == 1
+
+        review = Review.objects.create(
+            title=title, author=user, text='review', score=5
+        )
+        response, count = parent_queries(client.get, url, 'reviews_title')
+        assert response.status_code == HTTPStatus.OK
+        assert count == 0, (
+            f'Проверьте, что GET-запрос к непустому списку `{url}` не '
+            'загружает произведение отдельным запросом.'
+        )
+
+        for url in (
+            f'/api/v1/titles/{title.id + 1}/reviews/',
+            f'/api/v1/titles/{title.id + 1}/reviews/?pagination=cursor',
+            f'/api/v1/titles/{title.id + 1}/reviews/{review.id}/comments/',
+            f'/api/v1/titles/{title.id}/reviews/{review.id + 1}/comments/',
+        ):
+            assert client.get(url).status_code == HTTPStatus.NOT_FOUND, (
+                f'Проверьте, что GET-запрос к `{url}` возвращает 404.'
+            )
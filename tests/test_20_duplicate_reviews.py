@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Barrier
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Review, Title
+
+THREADS = 8
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20DuplicateReviews:
+
+    @pytest.fixture
+    def url(self):
+        title = Title.objects.create(name='Произведение', year=2000)
+        return f'/api/v1/titles/{title.id}/reviews/'
+
+    def test_01_duplicate_is_bad_request(self, user_client, url):
+        data = {'text': 'review', 'score': 5}
+        with CaptureQueriesContext(connection) as context:
+            response = user_client.post(url, data=data)
+        assert response.status_code == HTTPStatus.CREATED
+        assert not any(
+            'SELECT 1 AS "a"' in query['sql']
+            for query in context.captured_queries
+        ), (
+            f'Проверьте, что POST-запрос к `{url}` не проверяет наличие '
+            'отзыва отдельным запросом перед сохранением.'
+        )
+
+        response = user_client.post(url, data=data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'non_field_errors' in response.json()
+        assert Review.objects.count() == 1
+
+    def test_02_concurrent_duplicates(self, user_client, url):
+        barrier = Barrier(THREADS)
+
+        def post(_):
+            barrier.wait()
+            try:
+                return user_client.post(
+                    url, data={'text': 'review', 'score': 5}
+                ).status_code
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            statuses = sorted(executor.map(post, range(THREADS)))
+
+        assert statuses == (
+            [HTTPStatus.CREATED] + [HTTPStatus.BAD_REQUEST] * (THREADS - 1)
+        ), (
+            f'Проверьте, что одновременные POST-запросы к `{url}` от одного '
+            'автора создают один отзыв, а остальные получают ответ 400.'
+        )
+        title = Title.objects.get()
+        assert Review.objects.count() == 1
+        assert (title.rating_sum, title.rating_count) == (5, 1)
@@ -0,0 +1,124 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews import search
+from reviews.models import Title
+
+URL = '/api/v1/titles/'
+
+
+def names(client, query):
+    response = client.get(f'{URL}?{query}')
+    assert response.status_code == HTTPStatus.OK
+    return [title['name'] for title in response.json()['results']]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21TitleSearch:
+
+    @pytest.fixture
+    def titles(self):
+        return Title.objects.bulk_create(
+            Title(name=name, year=2000) for name in (
+                'Война и мир', 'Мир', 'Мирный атом', 'Peace "and" war',
+                'Преступление и наказание',
+            )
+        )
+
+    def test_01_name_filter(self, client, titles):
+        assert names(client, 'name=ВОЙНА') == ['Война и мир'], (
+            'Проверьте, что фильтр `name` ищет подстроку без учёта регистра.'
+        )
+        assert sorted(names(client, 'name=ирн')) == ['Мирный атом']
+        assert sorted(names(client, 'name=ир')) == [
+            'Война и мир', 'Мир', 'Мирный атом'
+        ]
+        assert names(client, 'name="and"') == ['Peace "and" war']
+        assert names(client, 'name=отсутствует') == []
+
+    def test_02_index_follows_changes(self, client, titles):
+        title = Title.objects.get(name='Мир')
+        title.name = 'Тишина'
+        title.save()
+        assert names(client, 'name=тишин') == ['Тишина'], (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'названия произведения.'
+        )
+        assert 'Тишина' not in names(client, 'name=мир')
+        title.delete()
+        assert names(client, 'name=тишин') == []
+
+    def test_03_ranked_search(self, client, titles):
+        found = names(client, 'search=мир')
+        assert sorted(found) == ['Война и мир', 'Мир', 'Мирный атом']
+        assert found[0] == 'Мир', (
+            'Проверьте, что параметр `search` упорядочивает произведения '
+            'по релевантности.'
+        )
+        assert names(client, 'search=мир+война') == ['Война и мир']
+        assert names(client, 'search=ан') == ['Преступление и наказание']
+        assert names(client, 'search=мир+ат') == ['Мирный атом'], (
+            'Проверьте, что короткие слова в параметре `search` тоже '
+            'учитываются.'
+        )
+
+    @pytest.mark.skipif(
+        connection.vendor != 'sqlite', reason='FTS5 используется в SQLite'
+    )
+    def test_04_uses_fts_index(self, client, titles):
+        with CaptureQueriesContext(connection) as context:
+            names(client, 'name=наказ')
+        assert any(
+            'MATCH' in query['sql'] and 'LIKE' not in query['sql']
+            for query in context.captured_queries
+        ), (
+            'Проверьте, что фильтр `name` использует полнотекстовый индекс.'
+        )
+
+    def test_05_without_fts_index(self, client, titles, monkeypatch):
+        monkeypatch.setattr(search, '_has_index', {})
+        monkeypatch.setattr(search, 'search_objects', lambda *args: set())
+        with CaptureQueriesContext(connection) as context:
+            assert names(client, 'name=наказ') == [
+                'Преступление и наказание'
+            ]
+            assert sorted(names(client, 'search=ир')) == [
+                'Война и мир', 'Мир', 'Мирный атом'
+            ]
+        assert not any(
+            'MATCH' in query['sql'] for query in context.captured_queries
+        ), (
+            'Проверьте, что без поискового индекса поиск работает через '
+            'обычный фильтр.'
+        )
+
+    @pytest.mark.skipif(
+        connection.vendor != 'sqlite', reason='FTS5 используется в SQLite'
+    )
+    def test_06_lost_triggers(self, client, titles, monkeypatch):
+        monkeypatch.setattr(search, '_has_index', {})
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER reviews_title_search_insert')
+        Title.objects.create(name='Тихий Дон', year=1928)
+
+        with CaptureQueriesContext(connection) as context:
+            assert names(client, 'name=Тихий') == ['Тихий Дон'], (
+                'Проверьте, что без триггеров поискового индекса фильтр '
+                '`name` не использует отставший индекс.'
+            )
+        assert not any(
+            'MATCH' in query['sql'] for query in context.captured_queries
+        )
+
+        emit_post_migrate_signal(0, False, connection.alias)
+        with CaptureQueriesContext(connection) as context:
+            assert names(client, 'name=Дон') == ['Тихий Дон'], (
+                'Проверьте, что после миграций триггеры поискового индекса '
+                'восстанавливаются, а индекс перестраивается.'
+            )
+        assert any(
+            'MATCH' in query['sql'] for query in context.captured_queries
+        )
@@ -0,0 +1,102 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Category, Genre
+
+URL = '/api/v1/titles/'
+
+
+def slug_lookups(context):
+    return [
+        query['sql'] for query in context.captured_queries
+        if '"slug" =' in query['sql'] or '"slug" IN' in query['sql']
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22SlugLookups:
+
+    @pytest.fixture
+    def catalog(self):
+        Category.objects.create(name='Фильм', slug='movie')
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(10)
+        )
+        return {
+            'name': 'Произведение',
+            'year': 2000,
+            'category': 'movie',
+            'genre': [f'genre-{idx}' for idx in range(10)],
+        }
+
+    def test_01_write_without_slug_queries(self, admin_client, catalog):
+        response = admin_client.post(URL, data=catalog)
+        assert response.status_code == HTTPStatus.CREATED
+
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.post(URL, data=catalog)
+        assert response.status_code == HTTPStatus.CREATED
+        assert sorted(response.json()['genre']) == sorted(catalog['genre'])
+        assert response.json()['category'] == 'movie'
+        assert not slug_lookups(context), (
+            f'Проверьте, что POST-запрос к `{URL}` не ищет категорию и '
+            'жанры по slug отдельными запросами.'
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.patch(
+                f'{URL}{response.json()["id"]}/',
+                data={'category': 'movie', 'genre': ['genre-1']}
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert not slug_lookups(context)
+
+    def test_02_map_follows_changes(self, admin_client, catalog):
+        assert admin_client.post(URL, data=catalog).status_code == (
+            HTTPStatus.CREATED
+        )
+        response = admin_client.post(
+            '/api/v1/genres/', data={'name': 'Новый', 'slug': 'new'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = admin_client.post(URL, data={**catalog, 'genre': ['new']})
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что новый жанр сразу доступен при создании '
+            'произведения.'
+        )
+
+        response = admin_client.delete('/api/v1/categories/movie/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        response = admin_client.post(URL, data=catalog)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что удалённую категорию нельзя указать при создании '
+            'произведения.'
+        )
+        assert 'category' in response.json()
+
+    def test_03_map_without_shared_version(self, admin_client, catalog,
+                                           settings):
+        assert admin_client.post(URL, data=catalog).status_code == (
+            HTTPStatus.CREATED
+        )
+        # update() не отправляет сигналов: так выглядит изменение,
+        # сделанное другим процессом со своим LocMemCache.
+        Genre.objects.filter(slug='genre-0').update(slug='renamed')
+        response = admin_client.post(
+            URL, data={**catalog, 'genre': ['renamed']}
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что при промахе карта slug перечитывается из базы.'
+        )
+
+        settings.SLUG_MAP_TIMEOUT = 0
+        Category.objects.filter(slug='movie').update(slug='film')
+        response = admin_client.post(URL, data=catalog)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что карта slug устаревает по времени '
+            '`SLUG_MAP_TIMEOUT`.'
+        )
+        assert 'category' in response.json()
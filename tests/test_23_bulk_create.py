@@ -0,0 +1,205 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection, transaction
+from django.db.transaction import TransactionManagementError
+from django.test.utils import CaptureQueriesContext
+from reviews.bulk import bulk_create_with_pks
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title)
+
+TITLES_URL = '/api/v1/titles/'
+
+
+def titles_payload(count, genres=('horror', 'comedy')):
+    return [
+        {
+            'name': f'Произведение {idx}',
+            'year': 2000,
+            'category': 'movie',
+            'genre': list(genres),
+        }
+        for idx in range(count)
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23BulkCreate:
+
+    @pytest.fixture
+    def catalog(self):
+        Category.objects.create(name='Фильм', slug='movie')
+        Genre.objects.create(name='Ужасы', slug='horror')
+        Genre.objects.create(name='Комедия', slug='comedy')
+
+    @pytest.fixture
+    def title(self):
+        return Title.objects.create(name='Произведение', year=2000)
+
+    def test_01_titles_list_payload(self, client, admin_client, catalog):
+        assert client.get(TITLES_URL).json()['count'] == 0
+        payload = titles_payload(3)
+        payload[0]['genre'].append('horror')
+
+        response = admin_client.post(TITLES_URL, data=payload, format='json')
+
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что POST-запрос администратора к `{TITLES_URL}` '
+            'принимает список произведений.'
+        )
+        data = response.json()
+        assert [title['name'] for title in data] == [
+            title['name'] for title in payload
+        ]
+        assert all(title['id'] for title in data)
+        assert all(
+            sorted(title['genre']) == ['comedy', 'horror'] for title in data
+        )
+        assert GenreTitle.objects.count() == 6
+        assert client.get(TITLES_URL).json()['count'] == 3, (
+            'Проверьте, что после массового создания кеш списка '
+            'произведений сбрасывается.'
+        )
+
+    def test_02_titles_query_count(self, admin_client, catalog):
+        def count(size):
+            with CaptureQueriesContext(connection) as context:
+                response = admin_client.post(
+                    TITLES_URL, data=titles_payload(size), format='json'
+                )
+            assert response.status_code == HTTPStatus.CREATED
+            return len(context.captured_queries)
+
+        assert count(2) == count(20), (
+            'Проверьте, что число запросов при массовом создании '
+            'произведений не зависит от их количества.'
+        )
+
+    def test_03_titles_item_errors(self, admin_client, catalog):
+        payload = titles_payload(3)
+        payload[1]['genre'] = ['unknown']
+        payload[2]['year'] = 'год'
+
+        response = admin_client.post(TITLES_URL, data=payload, format='json')
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()
+        assert len(errors) == 3
+        assert errors[0] == {}
+        assert 'genre' in errors[1], (
+            'Проверьте, что ошибки массового создания возвращаются для '
+            'каждого объекта отдельно.'
+        )
+        assert 'year' in errors[2]
+        assert Title.objects.count() == 0
+
+        response = admin_client.post(TITLES_URL, data=[], format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что массовое создание отклоняет пустой список.'
+        )
+
+    def test_04_reviews_bulk(self, client, admin_client, user_client, admin,
+                             user, moderator, title):
+        url = f'{TITLES_URL}{title.id}/reviews/bulk/'
+        payload = [
+            {'author': user.username, 'text': 'Отзыв', 'score': 4},
+            {'author': moderator.username, 'text': 'Отзыв', 'score': 8},
+        ]
+        response = user_client.post(url, data=payload, format='json')
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            f'Проверьте, что `{url}` доступен только администратору.'
+        )
+
+        response = admin_client.post(url, data=payload, format='json')
+
+        assert response.status_code == HTTPStatus.CREATED
+        data = response.json()
+        assert [review['author'] for review in data] == [
+            user.username, moderator.username
+        ]
+        assert all(review['id'] and review['pub_date'] for review in data)
+        response = client.get(f'{TITLES_URL}{title.id}/')
+        assert response.json()['rating'] == 6, (
+            'Проверьте, что массовое создание отзывов обновляет рейтинг '
+            'произведения.'
+        )
+        assert client.get(
+            f'{TITLES_URL}{title.id}/reviews/'
+        ).json()['count'] == 2
+
+    def test_05_reviews_bulk_errors(self, admin_client, admin, user,
+                                    moderator, title):
+        Review.objects.create(title=title, author=user, text='t', score=5)
+        url = f'{TITLES_URL}{title.id}/reviews/bulk/'
+        payload = [
+            {'author': admin.username, 'text': 'Отзыв', 'score': 5},
+            {'author': user.username, 'text': 'Отзыв', 'score': 5},
+            {'author': admin.username, 'text': 'Отзыв', 'score': 5},
+            {'author': 'nobody', 'text': 'Отзыв', 'score': 5},
+            {'author': moderator.username, 'text': 'Отзыв', 'score': 11},
+        ]
+
+        response = admin_client.post(url, data=payload, format='json')
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()
+        assert errors[0] == {}
+        assert 'non_field_errors' in errors[1], (
+            'Проверьте, что массовое создание отклоняет повторный отзыв '
+            'автора на произведение.'
+        )
+        assert 'non_field_errors' in errors[2]
+        assert 'author' in errors[3]
+        assert 'score' in errors[4]
+        assert Review.objects.count() == 1
+
+        response = admin_client.post(
+            f'{TITLES_URL}{title.id + 1}/reviews/bulk/',
+            data=payload[:1], format='json'
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_06_comments_bulk(self, client, admin_client, admin, user,
+                              title):
+        review = Review.objects.create(
+            title=title, author=user, text='t', score=5
+        )
+        url = f'{TITLES_URL}{title.id}/reviews/{review.id}/comments/'
+        assert client.get(url).json()['count'] == 0
+        payload = [
+            {'author': user.username, 'text': f'Комментарий {idx}'}
+            for idx in range(5)
+        ] + [{'author': admin.username, 'text': 'Комментарий'}]
+
+        response = admin_client.post(
+            f'{url}bulk/', data=payload, format='json'
+        )
+
+        assert response.status_code == HTTPStatus.CREATED
+        assert len(response.json()) == 6
+        assert Comment.objects.filter(review=review).count() == 6
+        assert client.get(url).json()['count'] == 6
+
+        response = admin_client.post(f'{url}bulk/', data=[], format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+        response = admin_client.post(
+            f'{url}bulk/', data=[{'author': 'nobody', 'text': 't'}],
+            format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'author' in response.json()[0]
+
+    def test_07_bulk_create_with_pks(self):
+        with pytest.raises(TransactionManagementError):
+            bulk_create_with_pks(Category, [Category(name='Книга', slug='a')])
+        assert Category.objects.count() == 0
+
+        with transaction.atomic():
+            categories = bulk_create_with_pks(Category, [
+                Category(name='Книга', slug='book'),
+                Category(name='Музыка', slug='music'),
+            ])
+        assert [category.pk for category in categories] == list(
+            Category.objects.order_by('pk').values_list('pk', flat=True)
+        )
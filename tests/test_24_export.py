@@ -0,0 +1,185 @@
+import csv
+import json
+import threading
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from api import views
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Category, Comment, Genre, GenreTitle, Review, Title
+
+URL = '/api/v1/export/'
+STATIC_HEADERS = {
+    'titles': ['id', 'name', 'year', 'category'],
+    'reviews': ['id', 'title_id', 'text', 'author', 'score', 'pub_date'],
+    'comments': ['id', 'review_id', 'text', 'author', 'pub_date'],
+}
+
+
+def content(response):
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming, (
+        'Проверьте, что выгрузка отдаётся потоком (StreamingHttpResponse).'
+    )
+    return b''.join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24Export:
+
+    @pytest.fixture
+    def catalog(self, user, moderator):
+        category = Category.objects.create(name='Фильм', slug='movie')
+        genres = [
+            Genre.objects.create(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(3)
+        ]
+        titles = [
+            Title.objects.create(
+                name=f'Произведение, "{idx}"', year=2000, category=category
+            )
+            for idx in range(4)
+        ]
+        GenreTitle.objects.bulk_create([
+            GenreTitle(title=titles[0], genre=genres[2]),
+            GenreTitle(title=titles[0], genre=genres[0]),
+            GenreTitle(title=titles[2], genre=genres[1]),
+        ])
+        review = Review.objects.create(
+            title=titles[0], author=user, text='Многострочный\nотзыв', score=7
+        )
+        Review.objects.create(
+            title=titles[0], author=moderator, text='Отзыв', score=4
+        )
+        Comment.objects.create(review=review, author=user, text='Коммент')
+        return titles, genres
+
+    def test_01_titles_csv(self, admin_client, catalog):
+        titles, genres = catalog
+
+        response = admin_client.get(f'{URL}titles/')
+
+        assert response['Content-Type'].startswith('text/csv')
+        assert 'titles.csv' in response['Content-Disposition']
+        rows = list(csv.DictReader(StringIO(content(response))))
+        assert list(rows[0])[:4] == STATIC_HEADERS['titles'], (
+            'Проверьте, что колонки выгрузки совпадают с '
+            '`static/data/titles.csv`.'
+        )
+        assert [row['id'] for row in rows] == [str(t.id) for t in titles]
+        assert rows[0]['name'] == titles[0].name
+        assert rows[0]['genre'] == f'{genres[0].id} {genres[2].id}'
+        assert rows[0]['rating'] == '5'
+        assert rows[1]['genre'] == '' and rows[1]['rating'] == ''
+        assert rows[2]['genre'] == str(genres[1].id)
+
+    @pytest.mark.parametrize('table', ('reviews', 'comments'))
+    def test_02_ndjson(self, admin_client, catalog, table):
+        response = admin_client.get(
+            f'{URL}{table}/?export_format=ndjson'
+        )
+
+        assert response['Content-Type'].startswith('application/x-ndjson')
+        rows = [json.loads(line) for line in content(response).splitlines()]
+        model = Review if table == 'reviews' else Comment
+        assert len(rows) == model.objects.count()
+        assert list(rows[0]) == STATIC_HEADERS[table]
+        first = model.objects.order_by('id').first()
+        assert rows[0]['text'] == first.text
+        assert rows[0]['author'] == first.author_id
+
+    def test_03_titles_queries(self, admin_client, catalog):
+        Title.objects.bulk_create(
+            Title(name=f'Ещё {idx}', year=2000) for idx in range(50)
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.get(f'{URL}titles/')
+            lines = content(response).splitlines()
+        assert len(lines) == 55
+        export_queries = [
+            query for query in context.captured_queries
+            if 'reviews_user' not in query['sql']
+        ]
+        assert len(export_queries) == 2, (
+            'Проверьте, что жанры произведений выгружаются одним потоком '
+            'связей, а не запросом на каждое произведение.'
+        )
+
+    def test_04_access(self, client, user_client, admin_client):
+        assert client.get(f'{URL}titles/').status_code == (
+            HTTPStatus.UNAUTHORIZED
+        )
+        assert user_client.get(f'{URL}titles/').status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+        assert admin_client.get(f'{URL}users/').status_code == (
+            HTTPStatus.NOT_FOUND
+        )
+        response = admin_client.get(f'{URL}titles/?export_format=xml')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_05_command(self, catalog, tmp_path):
+        call_command('export', path=str(tmp_path), stdout=StringIO())
+        for table, filename in (
+            ('titles', 'titles.csv'),
+            ('reviews', 'review.csv'),
+            ('comments', 'comments.csv'),
+        ):
+            with open(tmp_path / filename, encoding='utf-8') as file:
+                rows = list(csv.reader(file))
+            assert rows[0][:len(STATIC_HEADERS[table])] == (
+                STATIC_HEADERS[table]
+            )
+        assert len(rows) == 2
+
+        out = StringIO()
+        call_command('export', 'reviews', format='ndjson', stdout=out)
+        assert len(out.getvalue().splitlines()) == 2
+
+    @pytest.mark.parametrize('export_format', ('csv', 'ndjson'))
+    def test_06_asgi(self, admin_client, token_admin, catalog,
+                     export_format, monkeypatch):
+        url = f'{URL}titles/'
+        query = f'export_format={export_format}'
+        messages = []
+        threads = []
+        export_file = views.export_file
+
+        def tracked_export_file(*args):
+            threads.append(threading.get_ident())
+            return export_file(*args)
+
+        monkeypatch.setattr(views, 'export_file', tracked_export_file)
+
+        async def receive():
+            return {'type': 'http.request', 'body': b''}
+
+        async def send(message):
+            messages.append(message)
+
+        async_to_sync(ASGIHandler())({
+            'type': 'http',
+            'method': 'GET',
+            'path': url,
+            'query_string': query.encode(),
+            'headers': [
+                (b'host', b'testserver'),
+                (b'authorization',
+                 f'Bearer {token_admin["access"]}'.encode()),
+            ],
+        }, receive, send)
+
+        assert messages[0]['status'] == HTTPStatus.OK
+        body = b''.join(message.get('body', b'') for message in messages[1:])
+        assert body.decode() == content(admin_client.get(f'{url}?{query}')), (
+            'Проверьте, что под ASGI выгрузка отдаётся целиком.'
+        )
+        assert threads and threads[0] != threading.get_ident(), (
+            'Проверьте, что под ASGI файл выгрузки собирается вне потока '
+            'thread_sensitive, где выполняются остальные синхронные запросы.'
+        )
@@ -0,0 +1,76 @@
+import datetime
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from http import HTTPStatus
+from io import BytesIO
+
+import pytest
+from api import renderers
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+SAMPLE = OrderedDict((
+    ('name', 'Произведение «строка»\u2028\u2029'),
+    ('created', timezone.now()),
+    ('naive', datetime.datetime(2020, 1, 2, 3, 4, 5, 678901)),
+    ('date', datetime.date(2020, 1, 2)),
+    ('time', datetime.time(3, 4, 5, 678901)),
+    ('duration', datetime.timedelta(days=1, seconds=5)),
+    ('price', Decimal('10.50')),
+    ('uuid', uuid.UUID(int=1)),
+    ('lazy', gettext_lazy('Пользователь')),
+    ('numbers', [1, 2.5, None, True]),
+    ('nested', {1: 'int key', 'genre': [{'slug': 'drama'}]}),
+))
+
+
+@pytest.fixture(params=(True, False), ids=('orjson', 'stdlib'))
+def encoder(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(renderers, 'orjson', None)
+    elif renderers.orjson is None:
+        pytest.skip('orjson не установлен')
+
+
+class Test25JSONRenderer:
+
+    def test_01_same_output_as_drf(self, encoder):
+        assert renderers.FastJSONRenderer().render(SAMPLE) == (
+            JSONRenderer().render(SAMPLE)
+        ), (
+            'Проверьте, что `FastJSONRenderer` кодирует данные так же, как '
+            'стандартный `JSONRenderer`.'
+        )
+
+    def test_02_indent_falls_back(self, encoder):
+        media_type = 'application/json; indent=4'
+        assert renderers.FastJSONRenderer().render(SAMPLE, media_type) == (
+            JSONRenderer().render(SAMPLE, media_type)
+        )
+
+    def test_03_parser(self, encoder):
+        body = JSONRenderer().render({'name': 'Мир', 'genre': ['drama']})
+        parser = renderers.FastJSONParser()
+        assert parser.parse(BytesIO(body)) == JSONParser().parse(
+            BytesIO(body)
+        )
+        for invalid in (b'{"name": ', b'{"score": NaN}'):
+            with pytest.raises(ParseError):
+                parser.parse(BytesIO(invalid))
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_api_uses_renderer(self, admin_client, encoder):
+        response = admin_client.post(
+            '/api/v1/categories/',
+            data={'name': 'Фильм', 'slug': 'movie'},
+            format='json',
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert isinstance(
+            response.accepted_renderer, renderers.FastJSONRenderer
+        )
+        assert response.content == JSONRenderer().render(response.data)
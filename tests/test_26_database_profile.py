@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from threading import Barrier
+
+import pytest
+from django.core.signals import request_started
+from django.db import connection
+from reviews.models import Comment, Review, Title
+
+WRITERS = 16
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26DatabaseProfile:
+
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_01_sqlite_pragmas(self):
+        assert self.pragma('journal_mode') == 'wal', (
+            'Проверьте, что соединение с SQLite работает в режиме WAL.'
+        )
+        assert self.pragma('synchronous') == 1, (
+            'Проверьте, что для SQLite задан `synchronous = NORMAL`.'
+        )
+        assert self.pragma('temp_store') == 2
+        assert self.pragma('cache_size') == -64 * 1024
+
+    def test_02_connection_checks(self, monkeypatch):
+        connection.ensure_connection()
+        checks = []
+        usable = True
+
+        def is_usable():
+            checks.append(True)
+            return usable
+
+        monkeypatch.setattr(connection, 'is_usable', is_usable)
+        request_started.send(sender=None)
+        assert not checks, (
+            'Проверьте, что соединение не проверяется в начале запроса, '
+            'до первого обращения к базе.'
+        )
+        for _ in range(3):
+            Title.objects.exists()
+        assert len(checks) == 1, (
+            'Проверьте, что постоянное соединение проверяется один раз за '
+            'запрос, перед первым обращением к базе.'
+        )
+
+        usable = False
+        request_started.send(sender=None)
+        stale = connection.connection
+        assert not Title.objects.exists()
+        assert len(checks) == 2
+        assert connection.connection is not stale, (
+            'Проверьте, что оборванное за время простоя соединение '
+            'переоткрывается, а запрос выполняется без ошибки.'
+        )
+        Title.objects.exists()
+        assert len(checks) == 2, (
+            'Проверьте, что только что открытое соединение не проверяется.'
+        )
+
+    def test_03_concurrent_writers(self, admin, user_client):
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=admin, text='review', score=5
+        )
+        url = f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+        barrier = Barrier(WRITERS)
+
+        def post(number):
+            barrier.wait()
+            try:
+                return user_client.post(
+                    url, data={'text': f'comment {number}'}
+                ).status_code
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(WRITERS) as executor:
+            statuses = list(executor.map(post, range(WRITERS)))
+
+        assert statuses == [HTTPStatus.CREATED] * WRITERS, (
+            f'Проверьте, что {WRITERS} одновременных POST-запросов к `{url}` '
+            'успешно сохраняют комментарии.'
+        )
+        assert Comment.objects.filter(review=review).count() == WRITERS
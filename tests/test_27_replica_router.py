@@ -0,0 +1,122 @@
+from http import HTTPStatus
+
+import pytest
+from api.db import ReplicaRouter, read_from_replica
+from api.middleware import ReplicaRoutingMiddleware
+from django.test import RequestFactory
+from reviews.models import Title
+
+REPLICAS = ['replica_1', 'replica_2']
+
+
+class Test27ReplicaRouter:
+
+    @pytest.fixture
+    def router(self, settings):
+        settings.REPLICA_DATABASES = REPLICAS
+        return ReplicaRouter()
+
+    def route(self, method, handler):
+        request = getattr(RequestFactory(), method)('/api/v1/titles/')
+        return ReplicaRoutingMiddleware(handler)(request)
+
+    def test_01_outside_request_uses_primary(self, router):
+        assert router.db_for_read(Title) == 'default', (
+            'Проверьте, что вне HTTP-запроса чтение идёт в основную базу.'
+        )
+        assert router.db_for_write(Title) == 'default'
+
+    def test_02_safe_method_reads_from_replica(self, router):
+        aliases = self.route('get', lambda request: [
+            router.db_for_read(Title) for _ in range(20)
+        ])
+        assert set(aliases) <= set(REPLICAS) and aliases, (
+            'Проверьте, что чтение в GET-запросе идёт в реплики.'
+        )
+        assert not read_from_replica.get(), (
+            'Проверьте, что после запроса маршрутизация сбрасывается.'
+        )
+
+    def test_03_unsafe_method_uses_primary(self, router):
+        alias = self.route('post', lambda request: router.db_for_read(Title))
+        assert alias == 'default', (
+            'Проверьте, что чтение в POST-запросе идёт в основную базу.'
+        )
+
+    def test_04_reads_after_write_use_primary(self, router):
+        def handler(request):
+            before = router.db_for_read(Title)
+            router.db_for_write(Title)
+            return before, router.db_for_read(Title)
+
+        before, after = self.route('get', handler)
+        assert before in REPLICAS
+        assert after == 'default', (
+            'Проверьте, что после записи чтение до конца запроса идёт '
+            'в основную базу.'
+        )
+
+    def test_05_without_replicas(self, settings):
+        settings.REPLICA_DATABASES = []
+        alias = self.route(
+            'get', lambda request: ReplicaRouter().db_for_read(Title)
+        )
+        assert alias == 'default'
+
+    def test_06_migrations_only_on_primary(self, router):
+        assert router.allow_migrate('default', 'reviews')
+        assert not router.allow_migrate('replica_1', 'reviews')
+        assert router.allow_relation(Title(), Title())
+
+    @pytest.mark.django_db(transaction=True)
+    def test_07_api_reads_through_router(self, settings, monkeypatch,
+                                         client, admin_client):
+        settings.REPLICA_DATABASES = ['default']
+        settings.REPLICA_LAG_WINDOW = 0
+        chosen = []
+
+        def choice(aliases):
+            chosen.append(aliases[0])
+            return aliases[0]
+
+        monkeypatch.setattr('api.db.random.choice', choice)
+        response = admin_client.post(
+            '/api/v1/categories/', data={'name': 'Фильм', 'slug': 'films'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert not chosen, (
+            'Проверьте, что POST-запрос не читает из реплики.'
+        )
+        response = client.get('/api/v1/categories/')
+        assert response.status_code == HTTPStatus.OK
+        assert chosen, (
+            'Проверьте, что GET-запрос к `/api/v1/categories/` читает '
+            'из реплики.'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.usefixtures('shared_cache')
+    def test_08_cache_fill_after_write_uses_primary(
+            self, settings, monkeypatch, client, admin_client):
+        settings.REPLICA_DATABASES = ['default']
+        chosen = []
+
+        def choice(aliases):
+            chosen.append(aliases[0])
+            return aliases[0]
+
+        monkeypatch.setattr('api.db.random.choice', choice)
+        response = admin_client.post(
+            '/api/v1/categories/', data={'name': 'Фильм', 'slug': 'films'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        for url in ('/api/v1/categories/', '/api/v1/titles/'):
+            assert client.get(url).status_code == HTTPStatus.OK
+        assert not chosen, (
+            'Проверьте, что сразу после записи ответ для кэша читается из '
+            'основной базы, а не из отстающей реплики.'
+        )
+
+        settings.REPLICA_LAG_WINDOW = 0
+        assert client.get('/api/v1/genres/').status_code == HTTPStatus.OK
+        assert chosen
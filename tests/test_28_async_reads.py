@@ -0,0 +1,125 @@
+import asyncio
+import importlib
+import threading
+from http import HTTPStatus
+
+import pytest
+from api.views import TitleViewSet
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import clear_url_caches, resolve
+from reviews.models import Category, Comment, Genre, Review, Title
+
+
+def reload_urls():
+    for module in ('api.urls', 'api_yamdb.urls'):
+        importlib.reload(importlib.import_module(module))
+    clear_url_caches()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28AsyncReads:
+
+    @pytest.fixture(autouse=True)
+    def async_reads(self, settings):
+        settings.ASYNC_READS = True
+        reload_urls()
+        yield
+        settings.ASYNC_READS = False
+        reload_urls()
+
+    @pytest.fixture
+    def objects(self, admin):
+        title = Title.objects.create(name='Произведение', year=2000)
+        review = Review.objects.create(
+            title=title, author=admin, text='review', score=5
+        )
+        comment = Comment.objects.create(
+            review=review, author=admin, text='comment'
+        )
+        return title, review, comment
+
+    def request(self, method, url, **extra):
+        async def send():
+            return await getattr(AsyncClient(), method)(url, **extra)
+        return async_to_sync(send)()
+
+    def get(self, url, **extra):
+        return self.request('get', url, **extra)
+
+    def test_01_read_views_are_async(self, objects):
+        title, review, _ = objects
+        urls = (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{title.id}/',
+            f'/api/v1/titles/{title.id}/reviews/',
+            f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/',
+        )
+        for url in urls:
+            assert asyncio.iscoroutinefunction(resolve(url).func), (
+                f'Проверьте, что при ASYNC_READS обработчик `{url}` '
+                'асинхронный.'
+            )
+        assert not asyncio.iscoroutinefunction(
+            resolve('/api/v1/users/').func
+        )
+
+    def test_02_async_responses_match_sync(self, client, objects):
+        title, review, comment = objects
+        urls = (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{title.id}/',
+            f'/api/v1/titles/{title.id}/reviews/',
+            f'/api/v1/titles/{title.id}/reviews/{review.id}/',
+            f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/',
+            f'/api/v1/titles/{title.id}/reviews/{review.id}/comments/'
+            f'{comment.id}/',
+        )
+        for url in urls:
+            response = self.get(url)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что асинхронный GET-запрос к `{url}` '
+                'возвращает статус 200.'
+            )
+            assert response.json() == client.get(url).json()
+        response = self.get(f'/api/v1/titles/{title.id + 1}/reviews/')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_03_reads_leave_sync_thread(self, monkeypatch, token_admin):
+        threads = []
+        list_titles = TitleViewSet.list
+        create_title = TitleViewSet.create
+
+        def record(handler):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return handler(*args, **kwargs)
+            return wrapper
+
+        monkeypatch.setattr(TitleViewSet, 'list', record(list_titles))
+        monkeypatch.setattr(TitleViewSet, 'create', record(create_title))
+        Category.objects.create(name='Фильм', slug='films')
+        Genre.objects.create(name='Драма', slug='drama')
+        auth = {'authorization': f'Bearer {token_admin["access"]}'}
+        assert self.get('/api/v1/titles/', **auth).status_code == (
+            HTTPStatus.OK
+        )
+        response = self.request(
+            'post',
+            '/api/v1/titles/',
+            data={
+                'name': 'Новое', 'year': 2001,
+                'category': 'films', 'genre': ['drama'],
+            },
+            content_type='application/json',
+            **auth,
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.content
+        read_thread, write_thread = threads
+        assert read_thread != threading.get_ident(), (
+            'Проверьте, что чтение выполняется вне потока thread_sensitive.'
+        )
+        assert write_thread == threading.get_ident(), (
+            'Проверьте, что запись выполняется синхронно в потоке '
+            'thread_sensitive.'
+        )
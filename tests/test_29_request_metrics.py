@@ -0,0 +1,91 @@
+from http import HTTPStatus
+
+import pytest
+from api import metrics
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Title
+
+URL = '/api/v1/metrics/'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29RequestMetrics:
+
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self):
+        metrics.reset()
+        yield
+        metrics.reset()
+
+    def server_timing(self, response):
+        timings = {}
+        for entry in response['Server-Timing'].split(', '):
+            name, *params = entry.split(';')
+            timings[name] = dict(param.split('=', 1) for param in params)
+        return timings
+
+    def test_01_server_timing_header(self, client, settings):
+        Title.objects.create(name='Произведение', year=2000)
+        response = client.get('/api/v1/titles/')
+        assert not response.has_header('Server-Timing'), (
+            'Проверьте, что заголовок `Server-Timing` по умолчанию не '
+            'отдаётся: он раскрывает клиентам число SQL-запросов.'
+        )
+        assert metrics.report()['api:title-list']['count'] == 1, (
+            'Проверьте, что замеры для метрик пишутся и без заголовка '
+            '`Server-Timing`.'
+        )
+
+        settings.API_SERVER_TIMING = True
+        with CaptureQueriesContext(connection) as context:
+            response = client.get('/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        assert response.has_header('Server-Timing'), (
+            'Проверьте, что ответ API содержит заголовок `Server-Timing`.'
+        )
+        timings = self.server_timing(response)
+        assert set(timings) == {'db', 'serialize', 'total'}
+        assert timings['db']['desc'] == (
+            f'"{len(context.captured_queries)} queries"'
+        ), (
+            'Проверьте, что в `Server-Timing` указано число SQL-запросов.'
+        )
+        assert float(timings['total']['dur']) >= float(
+            timings['db']['dur']
+        )
+
+    def test_02_metrics_permissions(self, client, user_client):
+        assert client.get(URL).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(URL).status_code == HTTPStatus.FORBIDDEN
+
+    def test_03_metrics_report(self, client, admin_client):
+        title = Title.objects.create(name='Произведение', year=2000)
+        for _ in range(3):
+            client.get('/api/v1/titles/')
+        client.get(f'/api/v1/titles/{title.id}/reviews/')
+        client.get('/api/v1/unknown/')
+
+        response = admin_client.get(URL)
+        assert response.status_code == HTTPStatus.OK
+        report = response.json()
+        assert report['api:title-list']['count'] == 3, (
+            f'Проверьте, что `{URL}` группирует замеры по имени маршрута.'
+        )
+        assert report['api:reviews-list']['count'] == 1
+        assert set(report['api:title-list']) == {
+            'count', 'queries', 'db', 'serialize', 'total'
+        }
+        assert set(report['api:title-list']['total']) == {
+            'p50', 'p95', 'p99'
+        }
+        assert report['api:reviews-list']['queries']['p50'] > 0
+        assert not any('unknown' in route for route in report)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert metrics.percentile(values, 50) == 50
+    assert metrics.percentile(values, 95) == 95
+    assert metrics.percentile(values, 99) == 99
+    assert metrics.percentile([7], 99) == 7
@@ -0,0 +1,140 @@
+import pytest
+from django.contrib.auth.tokens import default_token_generator
+from django.db import transaction
+from reviews.models import (Category, Comment, Genre, GenreTitle, Review,
+                            Title, User)
+from reviews.ratings import rebuild_ratings
+
+
+OBJECTS = 12
+
+
+@pytest.mark.django_db(transaction=True)
+class Test30QueryBudget:
+
+    @pytest.fixture
+    def catalog(self, admin):
+        Category.objects.bulk_create(
+            Category(name=f'Категория {idx}', slug=f'category-{idx}')
+            for idx in range(OBJECTS)
+        )
+        Genre.objects.bulk_create(
+            Genre(name=f'Жанр {idx}', slug=f'genre-{idx}')
+            for idx in range(OBJECTS)
+        )
+        category = Category.objects.get(slug='category-0')
+        Title.objects.bulk_create(
+            Title(name=f'Произведение {idx}', year=2000, category=category)
+            for idx in range(OBJECTS)
+        )
+        genres = list(Genre.objects.all()[:2])
+        GenreTitle.objects.bulk_create(
+            GenreTitle(title=title, genre=genre)
+            for title in Title.objects.all()
+            for genre in genres
+        )
+        User.objects.bulk_create(
+            User(username=f'author{idx}', email=f'author{idx}@yamdb.fake')
+            for idx in range(OBJECTS)
+        )
+        title = Title.objects.order_by('id').first()
+        Review.objects.bulk_create(
+            Review(title=title, author=author, text='review', score=5)
+            for author in User.objects.filter(username__startswith='author')
+        )
+        with transaction.atomic():
+            rebuild_ratings()
+        review = Review.objects.order_by('id').first()
+        Comment.objects.bulk_create(
+            Comment(review=review, author=author, text='comment')
+            for author in User.objects.filter(username__startswith='author')
+        )
+        return title, review
+
+    @pytest.fixture
+    def admin_claims_client(self, create_claims_client, admin):
+        return create_claims_client(admin)
+
+    @pytest.fixture
+    def user_claims_client(self, create_claims_client, user):
+        return create_claims_client(user)
+
+    def test_01_catalog_lists(self, query_budget, admin_claims_client,
+                              catalog):
+        for url in ('/api/v1/titles/', '/api/v1/categories/',
+                    '/api/v1/genres/', '/api/v1/users/'):
+            query_budget.request_pages(admin_claims_client, url)
+
+    def test_02_title_filters(self, query_budget, user_claims_client,
+                              catalog):
+        for query in ('category=category-0', 'genre=genre-0', 'year=2000',
+                      'name=Произведение', 'search=Произведение 1'):
+            query_budget.request(
+                user_claims_client, 'get', f'/api/v1/titles/?{query}'
+            )
+
+    def test_03_titles(self, query_budget, client, admin_claims_client,
+                       catalog):
+        title, _ = catalog
+        url = f'/api/v1/titles/{title.id}/'
+        query_budget.request(client, 'get', '/api/v1/titles/')
+        query_budget.request(client, 'get', url)
+        query_budget.request(
+            admin_claims_client, 'post', '/api/v1/titles/', data={
+                'name': 'Новое', 'year': 2001, 'category': 'category-1',
+                'genre': ['genre-1', 'genre-2'],
+            }
+        )
+        query_budget.request(
+            admin_claims_client, 'patch', url, data={'year': 2002}
+        )
+        query_budget.request(admin_claims_client, 'delete', url)
+
+    @pytest.mark.parametrize('mode', ('', '?pagination=cursor'))
+    def test_04_review_and_comment_lists(self, query_budget, client,
+                                         user_claims_client, catalog, mode):
+        title, review = catalog
+        reviews_url = f'/api/v1/titles/{title.id}/reviews/'
+        comments_url = f'{reviews_url}{review.id}/comments/'
+        for url in (reviews_url, comments_url):
+            query_budget.request_pages(client, url + mode)
+            query_budget.request_pages(user_claims_client, url + mode)
+
+    def test_05_reviews_and_comments(self, query_budget, user_claims_client,
+                                     catalog):
+        title, review = catalog
+        reviews_url = f'/api/v1/titles/{title.id}/reviews/'
+        response, _ = query_budget.request(
+            user_claims_client, 'post', reviews_url,
+            data={'text': 'review', 'score': 7},
+        )
+        own_review_url = f'{reviews_url}{response.json()["id"]}/'
+        query_budget.request(user_claims_client, 'get', own_review_url)
+        query_budget.request(
+            user_claims_client, 'patch', own_review_url, data={'score': 3}
+        )
+        comments_url = f'{reviews_url}{review.id}/comments/'
+        response, _ = query_budget.request(
+            user_claims_client, 'post', comments_url,
+            data={'text': 'comment'},
+        )
+        query_budget.request(
+            user_claims_client, 'get',
+            f'{comments_url}{response.json()["id"]}/'
+        )
+        query_budget.request(user_claims_client, 'delete', own_review_url)
+
+    def test_06_auth_and_profile(self, query_budget, client,
+                                 user_claims_client, user):
+        query_budget.request(client, 'post', '/api/v1/auth/signup/', data={
+            'username': 'newcomer', 'email': 'newcomer@yamdb.fake',
+        })
+        query_budget.request(client, 'post', '/api/v1/auth/token/', data={
+            'username': user.username,
+            'confirmation_code': default_token_generator.make_token(user),
+        })
+        query_budget.request(user_claims_client, 'get', '/api/v1/users/me/')
+        query_budget.request(
+            user_claims_client, 'patch', '/api/v1/users/me/',
+            data={'bio': 'bio'},
+        )